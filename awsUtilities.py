@@ -0,0 +1,97 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# awsUtilities.py
+#
+# Purpose: Single command line entry point for all of the converters, installed as the
+#          "awsutilities" command.  Each subcommand is handed to the main() of the program
+#          that implements it:
+#
+#              awsutilities srt -transin myTranscript.json -srtout mySRT.srt
+#              awsutilities batch-vtt -transin transcripts/ -outdir captions/ -fstyle "A:middle"
+#
+#          Only the module of the chosen subcommand is imported, and nothing at all for the
+#          top level help, so the command starts quickly on every (cold) invocation.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import sys
+
+
+# Subcommand name, implementing module, arguments put in front of the user's, description
+COMMANDS = [
+	( "srt", "createSRTfromTranscriptionFile", [], "Create an SRT file from an AWS Transcribe JSON output" ),
+	( "vtt", "createVTTfromTranscriptionFile", [], "Create a VTT file from an AWS Transcribe JSON output" ),
+	( "ssml", "createSSMLfromTranscriptionFile", [], "Create an SSML file from an AWS Transcribe JSON output" ),
+	( "srt2ssml", "createSSMLfromSRT", [], "Create an SSML file from an SRT file" ),
+	( "retime", "retimeCaptions", [], "Re-time an SRT or VTT file, and/or convert it to the other format" ),
+	( "srt2vtt", "retimeCaptions", ["-format", "vtt"], "Convert an SRT file to a VTT file" ),
+	( "vtt2srt", "retimeCaptions", ["-format", "srt"], "Convert a VTT file to an SRT file" ),
+	( "batch", "batchConvert", [], "Convert a batch of AWS Transcribe JSON outputs" ),
+	( "batch-srt", "batchConvert", ["-formats", "srt"], "Convert a batch of AWS Transcribe JSON outputs to SRT" ),
+	( "batch-vtt", "batchConvert", ["-formats", "vtt"], "Convert a batch of AWS Transcribe JSON outputs to VTT" ),
+	( "batch-ssml", "batchConvert", ["-formats", "ssml"], "Convert a batch of AWS Transcribe JSON outputs to SSML" ),
+	( "queue", "jobQueue", [], "Queue conversions, and run them with priorities and per-tenant fair sharing" ),
+]
+
+PROG = "awsutilities"
+
+
+
+# ==================================================================================
+# Function: printUsage
+# Purpose: Print the list of subcommands
+# Parameters:
+#                 out - the stream to print to
+# ==================================================================================
+def printUsage( out ):
+	out.write( "usage: %s <command> [options]\n\n" % PROG )
+	out.write( "commands:\n" )
+	for name, module, preset, description in COMMANDS:
+		out.write( "  %-12s %s\n" % (name, description) )
+	out.write( "\nRun '%s <command> -h' for the options of a command.\n" % PROG )
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Look up the subcommand, import the module implementing it and run its main()
+# Parameters:
+#                 argv - the command line arguments, without the program name
+# ==================================================================================
+def main( argv=None ):
+	argv = sys.argv[1:] if argv is None else argv
+
+	if not argv or argv[0] in ( "-h", "--help" ):
+		printUsage( sys.stdout if argv else sys.stderr )
+		return 0 if argv else 2
+
+	for name, module, preset, description in COMMANDS:
+		if argv[0] == name:
+			import importlib
+			return importlib.import_module( module ).main( preset + argv[1:], prog=PROG + " " + name )
+
+	sys.stderr.write( "%s: unknown command '%s'\n\n" % (PROG, argv[0]) )
+	printUsage( sys.stderr )
+	return 2
+
+
+if __name__ == "__main__":
+	sys.exit( main() )
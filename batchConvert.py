@@ -0,0 +1,300 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# batchConvert.py
+#
+# Purpose: Converts a batch of AWS Transcribe JSON outputs into SRT, VTT, SSML or any other format
+#          with a writer registered in captionCore.
+#          Reading, converting and writing run as an asyncio pipeline so the CPU work on one
+#          transcript overlaps the (possibly slow, network) I/O of the others:
+#
+#              reader tasks --> read queue --> convert tasks --> write queue --> writer tasks
+#                (threads)                      (processes)                      (threads)
+#
+#          Both queues are bounded, so a slow stage holds back the stages in front of it
+#          instead of piling transcripts up in memory.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import codecs
+import os
+import sys
+import time
+
+import captionCore
+import s3Utils
+
+# asyncio, concurrent.futures and transcriptReader are imported where they are used, so -h
+# doesn't pay for loading them
+
+# Marks the end of the work on a queue
+DONE = None
+
+
+
+# ==================================================================================
+# Function: convertTranscript
+# Purpose: Parse a transcript and render it in each of the requested formats.  This runs in
+#          the CPU executor, so it only takes and returns plain strings
+# Parameters:
+#                 transcript - the JSON output from Amazon Transcribe
+#                 formats - the list of output formats, see captionCore.getWriterNames
+#                 fstyle - the style for VTT subtitles to appear on screen
+#                 pcttimepad - the % of padding to add to the SSML MAX Duration
+#                 backend - the JSON backend to decode the transcript with, see transcriptReader
+#                 lang - the language code of the transcript (e.g. "en", "ja-JP")
+# ==================================================================================
+def convertTranscript( transcript, formats, fstyle, pcttimepad, backend="auto", lang="en" ):
+	import transcriptReader
+
+	# the phrases are built once, and every format is rendered from them
+	phrases = captionCore.getPhrasesFromItems( transcriptReader.parseItems( transcript, backend ) )
+	options = { "fstyle": fstyle, "pcttimepad": pcttimepad, "lang": lang }
+
+	return dict( (fmt, captionCore.render( phrases, fmt, options )) for fmt in formats )
+
+
+# ==================================================================================
+# Function: readFile
+# Purpose: Blocking read of a transcript, run in the I/O executor
+# Parameters:
+#                 filename - the transcript file, or s3://bucket/key, to read
+# ==================================================================================
+def readFile( filename ):
+	if s3Utils.isS3Uri( filename ):
+		return s3Utils.readObject( filename )
+
+	# the bytes are decoded by the JSON backend in the converter, so an undecodable file fails
+	# there, as one transcript, rather than in the reader
+	with open( filename, "rb" ) as tfile:
+		return tfile.read()
+
+
+# ==================================================================================
+# Function: writeFile
+# Purpose: Blocking write of an output file, run in the I/O executor
+# Parameters:
+#                 filename - the file, or s3://bucket/key, to write
+#                 contents - the text to write to it
+# ==================================================================================
+def writeFile( filename, contents ):
+	if s3Utils.isS3Uri( filename ):
+		s3Utils.writeObject( filename, contents )
+		return
+
+	with codecs.open( filename, "w+", "utf-8" ) as out:
+		out.write( contents )
+
+
+# ==================================================================================
+# Function: getTranscriptFiles
+# Purpose: Expand the inputs into a list of transcript files.  Directories contribute all of
+#          the .json files directly inside them, and s3://bucket/prefix/ URIs all of the .json
+#          objects under the prefix
+# Parameters:
+#                 inputs - the list of files, directories and S3 URIs given on the command line
+# ==================================================================================
+def getTranscriptFiles( inputs ):
+	files = []
+	for name in inputs:
+		if s3Utils.isS3Uri( name ) and name.endswith( "/" ):
+			files.extend( s3Utils.listObjects( name, ".json" ) )
+		elif os.path.isdir( name ):
+			files.extend( sorted( os.path.join(name, f) for f in os.listdir(name) if f.lower().endswith(".json") ) )
+		else:
+			files.append( name )
+	return files
+
+
+# ==================================================================================
+# Function: getOutputName
+# Purpose: Work out the name of the output file for a transcript and format
+# Parameters:
+#                 transcriptFile - the transcript file being converted
+#                 outdir - the directory, or s3://bucket/prefix/, the outputs are written to
+#                 fmt - the output format, see captionCore.getWriterNames
+# ==================================================================================
+def getOutputName( transcriptFile, outdir, fmt ):
+	base = os.path.splitext( os.path.basename(transcriptFile) )[0] + captionCore.getWriter( fmt )[0]
+	if s3Utils.isS3Uri( outdir ):
+		return outdir.rstrip( "/" ) + "/" + base
+	return os.path.join( outdir, base )
+
+
+# ==================================================================================
+# Function: runPipeline
+# Purpose: Convert every transcript through the read / convert / write pipeline
+# Parameters:
+#                 files - the list of transcript files to convert
+#                 outdir - the directory the outputs are written to
+#                 formats - the list of output formats, see captionCore.getWriterNames
+#                 fstyle - the style for VTT subtitles to appear on screen
+#                 pcttimepad - the % of padding to add to the SSML MAX Duration
+#                 cpuworkers - the number of processes converting transcripts
+#                 ioworkers - the number of threads reading and writing files
+#                 prefetch - the bound of each queue between the stages
+#                 backend - the JSON backend to decode the transcripts with, see transcriptReader
+#                 lang - the language code of the transcripts
+# Returns: the list of (file, error) tuples for the transcripts that failed
+# ==================================================================================
+async def runPipeline( files, outdir, formats, fstyle, pcttimepad, cpuworkers, ioworkers, prefetch, backend="auto", lang="en" ):
+	import asyncio
+	from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+	loop = asyncio.get_running_loop()
+	pending = asyncio.Queue()
+	readQueue = asyncio.Queue( maxsize=prefetch )
+	writeQueue = asyncio.Queue( maxsize=prefetch )
+	failures = []
+
+	for f in files:
+		pending.put_nowait( f )
+
+	async def reader():
+		while not pending.empty():
+			f = pending.get_nowait()
+			try:
+				transcript = await loop.run_in_executor( ioPool, readFile, f )
+			except Exception as error:
+				failures.append( (f, error) )
+				continue
+			await readQueue.put( (f, transcript) )
+
+	async def converter():
+		while True:
+			work = await readQueue.get()
+			if work is DONE:
+				break
+			f, transcript = work
+			try:
+				outputs = await loop.run_in_executor( cpuPool, convertTranscript, transcript, formats, fstyle, pcttimepad, backend, lang )
+			except Exception as error:
+				failures.append( (f, error) )
+				continue
+			for fmt in formats:
+				await writeQueue.put( (f, getOutputName(f, outdir, fmt), outputs[fmt]) )
+
+	async def writer():
+		while True:
+			work = await writeQueue.get()
+			if work is DONE:
+				break
+			f, filename, contents = work
+			try:
+				await loop.run_in_executor( ioPool, writeFile, filename, contents )
+				print( "\t>>> " + f + " --> " + filename )
+			except Exception as error:
+				failures.append( (f, error) )
+
+	with ThreadPoolExecutor( ioworkers ) as ioPool, ProcessPoolExecutor( cpuworkers ) as cpuPool:
+		# every stage is drained in turn, then told to stop with one DONE per task
+		readers = [ asyncio.ensure_future( reader() ) for _ in range(ioworkers) ]
+		converters = [ asyncio.ensure_future( converter() ) for _ in range(cpuworkers) ]
+		writers = [ asyncio.ensure_future( writer() ) for _ in range(ioworkers) ]
+
+		await asyncio.gather( *readers )
+		for _ in converters:
+			await readQueue.put( DONE )
+		await asyncio.gather( *converters )
+		for _ in writers:
+			await writeQueue.put( DONE )
+		await asyncio.gather( *writers )
+
+	return failures
+
+
+# ==================================================================================
+# Function: getPositiveInt
+# Purpose: Return a number of workers or transcripts from the command line, which must be a
+#          whole number above zero, for argparse
+# Parameters:
+#                 value - the number from the command line
+# ==================================================================================
+def getPositiveInt( value ):
+	try:
+		number = int( value )
+	except ValueError:
+		raise argparse.ArgumentTypeError( "must be a whole number" )
+	# no workers would never finish the batch, and a queue of size 0 is unbounded
+	if number < 1:
+		raise argparse.ArgumentTypeError( "must be greater than 0" )
+	return number
+
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: After processing arguments, convert every transcript into the requested formats
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+
+def main( argv=None, prog='batchConvert.py' ):
+
+	# Get the command line arguments and parse them
+	parser = argparse.ArgumentParser( prog=prog, description='Convert a batch of JSON transcriptions from AWS Transcribe into SRT, VTT, SSML, TTML and/or JSON cue files')
+	parser.add_argument('-transin', required=True, nargs='+', help='The transcription files, directories or s3://bucket/prefix/ of them, to process')
+	parser.add_argument('-outdir', required=True, help='The directory, or s3://bucket/prefix/, to write the output files to')
+	parser.add_argument('-formats', required=False, nargs='+', default=['srt'], choices=captionCore.getWriterNames(), help='The output formats to create.  Default = srt')
+	parser.add_argument('-fstyle', required=False, default='', help='The style for VTT subtitles to appear on screen.  E.g. "A:middle L:90%%"')
+	parser.add_argument('-pcttimepad', required=False, default='1.0', help='The %% of padding to add to the SSML MAX Duration.  Default = 1 (100%%)')
+	parser.add_argument('-lang', required=False, default='en', help='The language code of the transcripts, e.g. ja-JP.  Default = en')
+	parser.add_argument('-cpuworkers', required=False, type=getPositiveInt, default=os.cpu_count() or 1, help='The number of processes converting transcripts.  Default = number of CPUs')
+	parser.add_argument('-ioworkers', required=False, type=getPositiveInt, default=8, help='The number of threads reading and writing files.  Default = 8')
+	parser.add_argument('-prefetch', required=False, type=getPositiveInt, default=16, help='The number of transcripts buffered between each stage.  Default = 16')
+	parser.add_argument('-json', required=False, default='auto', choices=['auto', 'orjson', 'simdjson', 'json'], help='The JSON backend to decode the transcripts with.  Default = auto (the fastest installed)')
+	parser.add_argument('-s3endpoint', required=False, default=None, help='The endpoint URL of an S3 compatible service to use for s3:// files.  Default = AWS S3')
+	args = parser.parse_args( argv )
+
+	# every I/O thread may run a few ranged GETs at once, so size the connection pool for them
+	s3Utils.configure( endpoint=args.s3endpoint, maxConnections=args.ioworkers * 4 )
+
+	files = getTranscriptFiles( args.transin )
+
+	# print out parameters and key header information for the user
+	print( "==> batchConvert.py <===\n")
+	print( "==> Parameters: ")
+	print( "\t>>> Transcription Files In: %d" % len(files) )
+	print( "\t>>> Output Directory: " + args.outdir )
+	print( "\t>>> Formats: " + ", ".join(args.formats) )
+	print( "\t>>> Language: " + args.lang )
+	print( "\t>>> CPU Workers: %d, I/O Workers: %d, Prefetch: %d\n" % (args.cpuworkers, args.ioworkers, args.prefetch) )
+
+	if not s3Utils.isS3Uri( args.outdir ):
+		os.makedirs( args.outdir, exist_ok=True )
+
+	import asyncio
+
+	print( "==> Processing Transcripts\n")
+	start = time.time()
+	failures = asyncio.run(
+		runPipeline( files, args.outdir, args.formats, args.fstyle, args.pcttimepad, args.cpuworkers, args.ioworkers, args.prefetch, args.json, args.lang ) )
+
+	for f, error in failures:
+		print( "\t>>> FAILED " + f + ": " + str(error) )
+
+	print( "\n==> Processed %d transcripts in %.2fs, %d failed\n" % (len(files), time.time() - start, len(failures)) )
+	sys.exit( -1 if failures else 0 )
+
+
+if __name__ == "__main__":
+	main()
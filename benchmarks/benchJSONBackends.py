@@ -0,0 +1,140 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# benchJSONBackends.py
+#
+# Purpose: Compares the time and peak memory of reading the items of large transcripts with
+#          each of the installed JSON backends of transcriptReader, against the original
+#          open().read() and json.loads.  Every backend must return the same items.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." ) )
+
+import transcriptReader
+from regressionHarness import makeTranscript
+
+
+
+# ==================================================================================
+# Function: readItemsOriginal
+# Purpose: The original input path of the converters, kept here as the baseline
+# Parameters:
+#                 name - the transcript file to read
+# ==================================================================================
+def readItemsOriginal( name ):
+	with open( name, "r" ) as tfile:
+		return json.loads( tfile.read() )["results"]["items"]
+
+
+# ==================================================================================
+# Function: getContents
+# Purpose: Reduce items to the fields the phrase builder uses, to compare backends
+# Parameters:
+#                 items - the results.items list
+# ==================================================================================
+def getContents( items ):
+	return [ (i["type"], i.get("start_time"), i.get("end_time"), i["alternatives"][0]["content"]) for i in items ]
+
+
+# ==================================================================================
+# Function: measure
+# Purpose: Return the best time in seconds, and the peak traced memory in bytes, of a reader
+# Parameters:
+#                 reader - the function reading the items
+#                 runs - the number of timed runs, the best one is used
+# ==================================================================================
+def measure( reader, runs ):
+	best = None
+	for _ in range( 0, runs ):
+		gc.collect()
+		start = time.perf_counter()
+		reader()
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min( best, elapsed )
+
+	tracemalloc.start()
+	try:
+		reader()
+		peak = tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+	return best, peak
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Benchmark every installed backend on each transcript
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='benchJSONBackends.py', description='Compare the JSON backends used to read transcripts')
+	parser.add_argument('-transin', required=False, nargs='+', default=[], help='The transcript files to read.  Default = synthetic transcripts of -items items')
+	parser.add_argument('-items', required=False, nargs='+', type=int, default=[50000, 200000], help='The sizes of the synthetic transcripts.  Default = 50000 200000')
+	parser.add_argument('-runs', required=False, type=int, default=5, help='The number of timed runs of each backend, the best one is used.  Default = 5')
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as workdir:
+		files = list( args.transin )
+		if not files:
+			for count in args.items:
+				files.append( os.path.join(workdir, "synthetic-%d.json" % count) )
+				with open( files[-1], "w" ) as f:
+					f.write( makeTranscript(count) )
+
+		backends = []
+		for backend in transcriptReader.BACKENDS:
+			try:
+				transcriptReader.getBackend( backend )
+				backends.append( backend )
+			except ImportError:
+				print( "==> %s is not installed, skipped" % backend )
+
+		for name in files:
+			expected = getContents( readItemsOriginal(name) )
+			print( "\n==> %s: %d items, %.1f MB\n" % (os.path.basename(name), len(expected), os.path.getsize(name) / 1e6) )
+
+			readers = [ ("read + json.loads", lambda: readItemsOriginal(name)) ]
+			readers += [ ("mmap + " + b, lambda b=b: transcriptReader.readItems(name, b)) for b in backends ]
+
+			baseline = None
+			for label, reader in readers:
+				if getContents( reader() ) != expected:
+					print( "\t>>> %-20s returned different items" % label )
+					continue
+
+				best, peak = measure( reader, args.runs )
+				baseline = baseline or best
+				print( "\t>>> %-20s %8.1f ms  %5.2fx  peak %7.1f MB" % (label, best * 1000, baseline / best, peak / 1e6) )
+
+	print( "" )
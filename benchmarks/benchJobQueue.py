@@ -0,0 +1,100 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# benchJobQueue.py
+#
+# Purpose: Measures the scheduling overhead of jobQueue.py, the time to claim and finish a
+#          job, at several queue depths, and checks the order it hands out jobs in: an
+#          interactive job submitted behind a backfill is claimed next, and two backfilling
+#          tenants share the claims in proportion to their weights.  No conversion is run, each
+#          job just takes the same short time.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." ) )
+
+import jobQueue
+
+
+
+# ==================================================================================
+# Function: fillQueue
+# Purpose: Create a queue with a backfill of jobs split between two tenants, the second
+#          with twice the weight of the first
+# Parameters:
+#                 db - the SQLite database file to create
+#                 depth - the number of jobs to queue
+# ==================================================================================
+def fillQueue( db, depth ):
+	conn = jobQueue.connect( db )
+	options = { "fstyle": "", "pcttimepad": "1.0", "json": "auto" }
+	for tenant in [ "teamA", "teamB" ]:
+		jobQueue.submitJobs( conn, [ "t%d.json" % x for x in range(0, depth // 2) ], "out", [ "srt" ], options, tenant, jobQueue.PRIORITIES["backfill"], 3 )
+	with jobQueue.transaction( conn ):
+		conn.execute( "UPDATE tenants SET weight = 2.0 WHERE tenant = 'teamB'" )
+	return conn
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Time the claims at each depth and report the order they came in
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='benchJobQueue.py', description='Measure the scheduling overhead and order of the job queue')
+	parser.add_argument('-depths', required=False, nargs='+', type=int, default=[1000, 10000, 100000], help='The queue depths to measure at.  Default = 1000 10000 100000')
+	parser.add_argument('-claims', required=False, type=int, default=600, help='The number of jobs claimed and finished at each depth.  Default = 600')
+	args = parser.parse_args()
+
+	with tempfile.TemporaryDirectory() as workdir:
+		for depth in args.depths:
+			conn = fillQueue( os.path.join(workdir, "queue-%d.db" % depth), depth )
+
+			# an interactive job arriving behind the whole backfill
+			urgent = jobQueue.submitJobs( conn, [ "urgent.json" ], "out", [ "srt" ], {}, "ops", jobQueue.PRIORITIES["interactive"], 3 )[0]
+
+			# every job "runs" for the same time, so the shares only depend on the weights
+			claimed = []
+			elapsed = 0.0
+			for _ in range( 0, args.claims ):
+				start = time.perf_counter()
+				job = jobQueue.claimJob( conn, "bench" )
+				elapsed += time.perf_counter() - start
+				time.sleep( 0.002 )
+				start = time.perf_counter()
+				jobQueue.finishJob( conn, job )
+				elapsed += time.perf_counter() - start
+				claimed.append( job )
+
+			shares = dict( (t, sum(1 for j in claimed[1:] if j["tenant"] == t)) for t in [ "teamA", "teamB" ] )
+			print( "\t>>> depth %7d  %6.2f ms per claim and finish  interactive first: %-5s  teamA:teamB = %d:%d (weights 1:2)" % (depth,
+			       elapsed * 1000 / args.claims, claimed[0]["id"] == urgent, shares["teamA"], shares["teamB"]) )
+			conn.close()
+
+	print( "" )
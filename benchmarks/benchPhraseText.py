@@ -0,0 +1,117 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# benchPhraseText.py
+#
+# Purpose: Measures the per-word cost of assembling the cue text for a phrase.  Compares the
+#          original regex based getPhraseText against the current type based one, both with
+#          and without the XML escaping done for the SSML output.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import os
+import random
+import re
+import sys
+import timeit
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." ) )
+
+import createSSMLfromTranscriptionFile as ssml
+
+
+
+# ==================================================================================
+# Function: getPhraseTextRegex
+# Purpose: The original implementation of getPhraseText, kept here as the baseline
+# Parameters: 
+#                 phrase - the phrase to assemble the text for
+# ==================================================================================
+def getPhraseTextRegex( phrase ):
+
+	length = len(phrase["words"])
+		
+	out = ""
+	for i in range( 0, length ):
+		if re.match( '[a-zA-Z0-9]', phrase["words"][i]):
+			if i > 0:
+				out += " " + phrase["words"][i]
+			else:
+				out += phrase["words"][i]
+		else:
+			out += phrase["words"][i]
+			
+	return out
+
+
+# ==================================================================================
+# Function: makePhrases
+# Purpose: Build a list of phrases of 10 words each, with roughly 15% punctuation
+# Parameters: 
+#                 count - the number of phrases to build
+# ==================================================================================
+def makePhrases( count ):
+	words = "the quick brown fox jumps over a lazy dog & cat < mouse > über café 1999".split()
+	rnd = random.Random( 42 )
+
+	phrases = []
+	for _ in range( 0, count ):
+		phrase = ssml.newPhrase()
+		for _ in range( 0, 10 ):
+			if phrase["words"] and rnd.random() < 0.15:
+				phrase["words"].append( rnd.choice(".,?") )
+				phrase["types"].append( "punctuation" )
+			else:
+				phrase["words"].append( rnd.choice(words) )
+				phrase["types"].append( "pronunciation" )
+		phrases.append( phrase )
+
+	return phrases
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Time every variant and print the cost per word
+# Parameters: See arg parser arguments
+#                 
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='benchPhraseText.py', description='Benchmark the cue text assembly used by the converters')
+	parser.add_argument('-phrases', required=False, type=int, default=20000, help='The number of 10 word phrases to assemble.  Default = 20000')
+	parser.add_argument('-repeat', required=False, type=int, default=5, help='The number of timed runs, the best one is reported.  Default = 5')
+	args = parser.parse_args()
+
+	phrases = makePhrases( args.phrases )
+	words = sum( len(p["words"]) for p in phrases )
+
+	variants = [
+		( "regex getPhraseText", lambda: [ getPhraseTextRegex(p) for p in phrases ] ),
+		( "typed getPhraseText", lambda: [ ssml.getPhraseText(p) for p in phrases ] ),
+		( "regex + no escaping (old SSML)", lambda: "".join( [ getPhraseTextRegex(p) for p in phrases ] ) ),
+		( "typed + escapeXML (new SSML)", lambda: "".join( [ ssml.escapeXML( ssml.getPhraseText(p) ) for p in phrases ] ) ),
+	]
+
+	print( "==> %d phrases, %d words, best of %d\n" % (len(phrases), words, args.repeat) )
+	for name, fn in variants:
+		best = min( timeit.repeat( fn, number=1, repeat=args.repeat ) )
+		print( "\t>>> %-32s %8.1f ns/word" % (name, best / words * 1e9) )
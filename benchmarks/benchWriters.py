@@ -0,0 +1,109 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# benchWriters.py
+#
+# Purpose: Measures the cost of each registered writer in isolation.  The transcript is
+#          parsed and its phrases built once, up front, and then every writer renders the same
+#          phrases, so the times and peak memory reported are those of the writer alone.  The
+#          shared parse and phrase stages are reported too, for scale.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import gc
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert( 0, os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." ) )
+
+import captionCore
+import transcriptReader
+from regressionHarness import makeTranscript
+
+# The options every writer is given
+OPTIONS = { "fstyle": "A:middle L:90%", "pcttimepad": "1.0", "lang": "en" }
+
+
+
+# ==================================================================================
+# Function: measure
+# Purpose: Return the best time in seconds, and the peak traced memory in bytes, of a function
+# Parameters:
+#                 function - the function to measure
+#                 runs - the number of timed runs, the best one is used
+# ==================================================================================
+def measure( function, runs ):
+	best = None
+	for _ in range( 0, runs ):
+		gc.collect()
+		start = time.perf_counter()
+		function()
+		elapsed = time.perf_counter() - start
+		best = elapsed if best is None else min( best, elapsed )
+
+	tracemalloc.start()
+	try:
+		function()
+		peak = tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+	return best, peak
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Benchmark the shared stages and every registered writer
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='benchWriters.py', description='Measure the cost of each caption writer in isolation')
+	parser.add_argument('-transin', required=False, default=None, help='The transcript file to use.  Default = a synthetic transcript of -items items')
+	parser.add_argument('-items', required=False, type=int, default=100000, help='The size of the synthetic transcript.  Default = 100000')
+	parser.add_argument('-writers', required=False, nargs='+', default=None, help='The writers to measure.  Default = all of the registered writers')
+	parser.add_argument('-runs', required=False, type=int, default=5, help='The number of timed runs of each writer, the best one is used.  Default = 5')
+	args = parser.parse_args()
+
+	if args.transin:
+		with open( args.transin, "rb" ) as f:
+			transcript = f.read()
+	else:
+		transcript = makeTranscript( args.items )
+
+	items = transcriptReader.parseItems( transcript )
+	phrases = captionCore.getPhrasesFromItems( items )
+	print( "==> %d items, %d phrases\n" % (len(items), len(phrases)) )
+
+	stages = [ ("parse (" + transcriptReader.getBackend() + ")", lambda: transcriptReader.parseItems( transcript )),
+	           ("phrases", lambda: captionCore.getPhrasesFromItems( items )) ]
+	for name in ( args.writers or captionCore.getWriterNames() ):
+		stages.append( ( "writer " + name, lambda name=name: captionCore.render( phrases, name, OPTIONS ) ) )
+
+	for label, function in stages:
+		best, peak = measure( function, args.runs )
+		print( "\t>>> %-20s %8.1f ms  %6.2f us/phrase  peak %7.1f MB" % (label, best * 1000, best * 1e6 / max(len(phrases), 1), peak / 1e6) )
+
+	print( "" )
@@ -0,0 +1,147 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# checkStartupTime.py
+#
+# Purpose: Enforces the start-up budget of the awsutilities command.  Every case is run in a
+#          fresh interpreter, as a serverless invocation would be, and fails the check when:
+#
+#              - it imports one of the modules it has no use for (a deterministic check that
+#                catches an eager import as soon as it is added), or
+#              - its best wall-clock time over the runs exceeds the time of a bare interpreter
+#                by more than the case's budget
+#
+#          Exits with a non-zero status if any case fails, so it can gate the CI build.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+
+ROOT = os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." )
+CLI = os.path.join( ROOT, "awsUtilities.py" )
+
+# Modules that a --help must never load
+HEAVY = [ "json", "asyncio", "multiprocessing", "concurrent.futures", "boto3", "botocore",
+          "mergeTranscripts", "transcriptReader", "orjson", "simdjson" ]
+
+# Modules that a small, serial, local conversion must never load
+CONVERSION_HEAVY = [ "asyncio", "multiprocessing", "concurrent.futures", "boto3", "botocore",
+                     "mergeTranscripts" ]
+
+# A tiny transcript used for the small conversion case
+TRANSCRIPT = { "results": { "items": [
+	{ "type": "pronunciation", "start_time": "%.2f" % (i * 0.5), "end_time": "%.2f" % (i * 0.5 + 0.4),
+	  "alternatives": [ { "content": "word" } ] } for i in range(0, 40) ] } }
+
+
+
+# ==================================================================================
+# Function: getCases
+# Purpose: Return the (name, arguments, forbidden modules, budget in ms) of every case
+# Parameters:
+#                 workdir - a scratch directory for the input and output files
+#                 scale - multiplier applied to every time budget
+# ==================================================================================
+def getCases( workdir, scale ):
+	transin = os.path.join( workdir, "transcript.json" )
+	with open( transin, "w" ) as f:
+		json.dump( TRANSCRIPT, f )
+
+	cases = [ ( "--help", [ "--help" ], HEAVY, 25 ) ]
+	for command in [ "srt", "vtt", "ssml", "srt2ssml", "retime", "batch", "queue" ]:
+		cases.append( ( command + " -h", [ command, "-h" ], HEAVY, 40 ) )
+
+	cases.append( ( "srt (small file)", [ "srt", "-transin", transin, "-srtout", os.path.join(workdir, "out.srt") ],
+	                CONVERSION_HEAVY, 60 ) )
+
+	return [ (name, argv, forbidden, budget * scale) for name, argv, forbidden, budget in cases ]
+
+
+# ==================================================================================
+# Function: getBestTime
+# Purpose: Run a command several times in a fresh interpreter and return the best time in ms
+# Parameters:
+#                 argv - the interpreter arguments
+#                 runs - the number of runs
+# ==================================================================================
+def getBestTime( argv, runs ):
+	best = None
+	for _ in range( 0, runs ):
+		start = time.perf_counter()
+		subprocess.run( [ sys.executable ] + argv, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL )
+		elapsed = ( time.perf_counter() - start ) * 1000
+		best = elapsed if best is None else min( best, elapsed )
+	return best
+
+
+# ==================================================================================
+# Function: getImportedModules
+# Purpose: Return the set of modules a command imports, using the -X importtime report
+# Parameters:
+#                 argv - the arguments to the CLI
+# ==================================================================================
+def getImportedModules( argv ):
+	result = subprocess.run( [ sys.executable, "-X", "importtime", CLI ] + argv,
+	                         stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, universal_newlines=True )
+
+	modules = set()
+	for line in result.stderr.splitlines():
+		if line.startswith( "import time:" ) and "|" in line:
+			modules.add( line.rsplit( "|", 1 )[1].strip() )
+	return modules
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Check every case against its budget and report the results
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='checkStartupTime.py', description='Check the start-up time budget of the awsutilities command')
+	parser.add_argument('-runs', required=False, type=int, default=10, help='The number of runs of each case, the best one is used.  Default = 10')
+	parser.add_argument('-scale', required=False, type=float, default=1.0, help='Multiplier for the time budgets, for slow machines.  Default = 1.0')
+	args = parser.parse_args()
+
+	failures = 0
+	with tempfile.TemporaryDirectory() as workdir:
+		baseline = getBestTime( [ "-c", "pass" ], args.runs )
+		print( "==> Bare interpreter: %.1f ms\n" % baseline )
+
+		for name, argv, forbidden, budget in getCases( workdir, args.scale ):
+			overhead = getBestTime( [ CLI ] + argv, args.runs ) - baseline
+			loaded = sorted( m for m in forbidden if m in getImportedModules(argv) )
+
+			ok = overhead <= budget and not loaded
+			failures += not ok
+			print( "\t>>> %-4s %-18s %6.1f ms over bare (budget %.0f ms)%s" % ( "ok" if ok else "FAIL", name, overhead, budget,
+			       "  imports: " + ", ".join(loaded) if loaded else "" ) )
+
+	print( "\n==> %d case(s) over budget\n" % failures )
+	sys.exit( 1 if failures else 0 )
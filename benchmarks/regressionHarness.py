@@ -0,0 +1,362 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# regressionHarness.py
+#
+# Purpose: Guards the transcript converters against output and performance regressions.
+#          Two checks are run, and any failure makes the harness exit with a non-zero status:
+#
+#              golden - every transcript in benchmarks/fixtures is converted to SRT, VTT and
+#                       SSML (and the SRT on to SSML with createSSMLfromSRT.py), TTML and JSON
+#                       cues, and the bytes written must match the golden files in
+#                       benchmarks/fixtures/golden
+#              perf   - each stage of a conversion of a large synthetic transcript is timed and
+#                       its peak memory traced, and must stay within the budgets stored in
+#                       benchmarks/fixtures/budgets.json, plus a tolerance
+#
+#          Times are divided by the time of a fixed calibration loop, so the budgets carry
+#          over between machines of different speeds.  Peak memory is measured per transcript
+#          item with tracemalloc.  After an intended change of the output or the performance,
+#          re-record the goldens with -updategoldens and the budgets with -updatebudgets.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import contextlib
+import gc
+import io
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.join( os.path.dirname( os.path.abspath(__file__) ), ".." )
+sys.path.insert( 0, ROOT )
+
+import captionCore
+import createSRTfromTranscriptionFile as srt
+import createVTTfromTranscriptionFile as vtt
+import createSSMLfromTranscriptionFile as ssml
+import createSSMLfromSRT
+import transcriptReader
+
+
+FIXTURES = os.path.join( ROOT, "benchmarks", "fixtures" )
+GOLDEN = os.path.join( FIXTURES, "golden" )
+BUDGETS = os.path.join( FIXTURES, "budgets.json" )
+
+# The options every fixture is converted with
+FSTYLE = "A:middle L:90%"
+PCTTIMEPAD = "1.0"
+
+# The language of the fixtures that aren't English
+LANGS = { "cjk.json": "ja-JP" }
+
+# The output files of each fixture, by the extension of the golden file
+OUTPUTS = [ ".srt", ".vtt", ".ssml", ".srt.ssml", ".ttml", ".cues.json" ]
+
+# Words of the synthetic transcript, including ones that need escaping or aren't ASCII
+WORDS = "the quick brown fox jumps over a lazy dog & cat < mouse > über café 東京 1999".split()
+
+
+
+# ==================================================================================
+# Function: quietly
+# Purpose: Run a function with its progress messages suppressed, and return its result
+# Parameters:
+#                 function - the function to run
+#                 args - the arguments to pass to it
+# ==================================================================================
+def quietly( function, *args ):
+	with contextlib.redirect_stdout( io.StringIO() ):
+		return function( *args )
+
+
+# ==================================================================================
+# Function: readBytes
+# Purpose: Return the contents of a file as bytes, or None if it doesn't exist
+# Parameters:
+#                 filename - the file to read
+# ==================================================================================
+def readBytes( filename ):
+	if not os.path.exists( filename ):
+		return None
+	with open( filename, "rb" ) as f:
+		return f.read()
+
+
+# ==================================================================================
+# Function: getFixtures
+# Purpose: Return the file names of the fixture transcripts, in order
+# Parameters:
+#                 None
+# ==================================================================================
+def getFixtures():
+	return sorted( f for f in os.listdir(FIXTURES) if f.endswith(".json") and f != "budgets.json" )
+
+
+# ==================================================================================
+# Function: convertFixture
+# Purpose: Convert a transcript through each of the converters' file writers, exactly as the
+#          command line programs do, and return the bytes written for each output
+# Parameters:
+#                 transcript - the JSON output from Amazon Transcribe
+#                 workdir - a scratch directory for the output files
+#                 lang - the language code of the transcript
+# ==================================================================================
+def convertFixture( transcript, workdir, lang="en" ):
+	names = dict( (ext, os.path.join(workdir, "out" + ext)) for ext in OUTPUTS )
+
+	quietly( srt.writeTranscriptToSRT, transcript, lang, names[".srt"] )
+	quietly( vtt.writeTranscriptToVTT, transcript, lang, names[".vtt"], FSTYLE )
+	quietly( ssml.writeTranscriptToSSML, transcript, lang, names[".ssml"], PCTTIMEPAD )
+	quietly( createSSMLfromSRT.main, [ "-srtin", names[".srt"], "-ssmlout", names[".srt.ssml"], "-pcttimepad", PCTTIMEPAD ] )
+
+	# the formats without a converter of their own go through the writer registry
+	phrases = quietly( captionCore.getPhrasesFromTranscript, transcript )
+	captionCore.writeCaptions( phrases, names[".ttml"], "ttml", { "lang": lang } )
+	captionCore.writeCaptions( phrases, names[".cues.json"], "cues", { "lang": lang } )
+
+	return dict( (ext, readBytes(name)) for ext, name in names.items() )
+
+
+# ==================================================================================
+# Function: checkGoldens
+# Purpose: Compare the outputs of every fixture with its golden files
+# Parameters:
+#                 update - write the outputs as the new golden files instead of comparing
+# Returns: the number of outputs that don't match
+# ==================================================================================
+def checkGoldens( update ):
+	print( "==> Golden outputs\n" )
+	failures = 0
+
+	with tempfile.TemporaryDirectory() as workdir:
+		for fixture in getFixtures():
+			with open( os.path.join(FIXTURES, fixture), "r", encoding="utf-8" ) as f:
+				outputs = convertFixture( f.read(), workdir, LANGS.get(fixture, "en") )
+
+			for ext in OUTPUTS:
+				golden = os.path.join( GOLDEN, os.path.splitext(fixture)[0] + ext )
+
+				if update:
+					with open( golden, "wb" ) as f:
+						f.write( outputs[ext] )
+					status = "saved"
+				else:
+					status = "ok" if outputs[ext] == readBytes( golden ) else "FAIL"
+					failures += status == "FAIL"
+
+				print( "\t>>> %-5s %s" % (status, os.path.relpath(golden, ROOT)) )
+
+	print( "" )
+	return failures
+
+
+# ==================================================================================
+# Function: makeTranscript
+# Purpose: Return a deterministic synthetic transcript, with about 15% punctuation and timings
+#          that run for several hours
+# Parameters:
+#                 count - the number of items in the transcript
+# ==================================================================================
+def makeTranscript( count ):
+	rnd = random.Random( 42 )
+	items = []
+	t = 0.0
+
+	for _ in range( 0, count ):
+		if items and items[-1]["type"] == "pronunciation" and rnd.random() < 0.15:
+			items.append( { "alternatives": [ { "confidence": "0.0", "content": rnd.choice(".,?") } ], "type": "punctuation" } )
+		else:
+			duration = rnd.uniform( 0.1, 0.6 )
+			items.append( { "start_time": "%.2f" % t, "end_time": "%.2f" % (t + duration), "type": "pronunciation",
+			                "alternatives": [ { "confidence": "0.99", "content": rnd.choice(WORDS) } ] } )
+			t += duration + rnd.uniform( 0, 0.3 )
+
+	return json.dumps( { "jobName": "synthetic", "results": { "items": items }, "status": "COMPLETED" } )
+
+
+# ==================================================================================
+# Function: calibrate
+# Purpose: Return the best time in seconds of a fixed, pure Python workload, used as the unit
+#          the stage times are measured in
+# Parameters:
+#                 runs - the number of runs, the best one is used
+# ==================================================================================
+def calibrate( runs ):
+	def workload():
+		parts = {}
+		for i in range( 0, 200000 ):
+			parts[i % 1000] = "%d:%s" % (i, "x" * (i % 7))
+		return "".join( parts.values() )
+
+	return getBestTime( workload, runs )
+
+
+# ==================================================================================
+# Function: getBestTime
+# Purpose: Return the best wall-clock time in seconds of several runs of a function.  As in
+#          timeit, the garbage collector is paused so its passes don't land in random runs
+# Parameters:
+#                 function - the function to time
+#                 runs - the number of runs
+# ==================================================================================
+def getBestTime( function, runs ):
+	best = None
+	for _ in range( 0, runs ):
+		gc.collect()
+		gc.disable()
+		try:
+			start = time.perf_counter()
+			function()
+			elapsed = time.perf_counter() - start
+		finally:
+			gc.enable()
+		best = elapsed if best is None else min( best, elapsed )
+	return best
+
+
+# ==================================================================================
+# Function: getPeakMemory
+# Purpose: Return the peak memory in bytes allocated while a function runs.  Memory that was
+#          already allocated before it was called, like its inputs, isn't counted
+# Parameters:
+#                 function - the function to measure
+# ==================================================================================
+def getPeakMemory( function ):
+	tracemalloc.start()
+	try:
+		function()
+		return tracemalloc.get_traced_memory()[1]
+	finally:
+		tracemalloc.stop()
+
+
+# ==================================================================================
+# Function: getStages
+# Purpose: Return the (name, function) of each stage of a conversion of a transcript.  Each
+#          stage works on the output of the ones before it, which is prepared up front
+# Parameters:
+#                 transcript - the JSON output from Amazon Transcribe
+# ==================================================================================
+def getStages( transcript ):
+	items = json.loads( transcript )["results"]["items"]
+	phrases = srt.getPhrasesFromItems( items )
+	vttPhrases = vtt.getPhrasesFromItems( items )
+	times = [ float(item["start_time"]) for item in items if item["type"] == "pronunciation" ]
+
+	return [
+		( "parse", lambda: transcriptReader.parseItems( transcript, "json" ) ),
+		( "phrases", lambda: srt.getPhrasesFromItems( items ) ),
+		( "timecode", lambda: [ srt.getTimeCode(t) for t in times ] ),
+		( "text", lambda: [ srt.getPhraseText(phrase) for phrase in phrases ] ),
+		( "srt", lambda: srt.getSRT( phrases ) ),
+		( "vtt", lambda: vtt.getVTT( vttPhrases, FSTYLE ) ),
+		( "ssml", lambda: ssml.getSSML( phrases, PCTTIMEPAD ) ),
+	]
+
+
+# ==================================================================================
+# Function: checkPerformance
+# Purpose: Measure the time and peak memory of each stage, and compare them with the budgets
+# Parameters:
+#                 count - the number of items in the synthetic transcript
+#                 runs - the number of timed runs of each stage, the best one is used
+#                 timeTolerance - the fraction a stage may be slower than its budget
+#                 memoryTolerance - the fraction a stage may use more memory than its budget
+#                 update - record the measurements as the new budgets instead of comparing
+# Returns: the number of budgets exceeded
+# ==================================================================================
+def checkPerformance( count, runs, timeTolerance, memoryTolerance, update ):
+	print( "==> Performance of %d items, in units of the calibration loop\n" % count )
+
+	budgets = {}
+	if not update:
+		with open( BUDGETS, "r" ) as f:
+			budgets = json.load( f )
+		if budgets["items"] != count:
+			print( "\t>>> The budgets were recorded for %d items, use -items %d" % (budgets["items"], budgets["items"]) )
+			return 1
+
+	failures = 0
+	measured = {}
+	for name, function in getStages( makeTranscript(count) ):
+		# calibrate next to every stage, so a change in the load of the machine hits both alike
+		stageTime = getBestTime( function, runs ) / calibrate( runs )
+		stageMemory = getPeakMemory( function ) / float( count )
+		measured[name] = { "time": round( stageTime, 4 ), "bytesPerItem": round( stageMemory, 1 ) }
+
+		if update:
+			print( "\t>>> saved %-8s %8.4f units %8.1f bytes/item" % (name, stageTime, stageMemory) )
+			continue
+
+		budget = budgets["stages"].get( name )
+		if budget is None:
+			print( "\t>>> FAIL  %-8s has no budget, record one with -updatebudgets" % name )
+			failures += 1
+			continue
+
+		timeOk = stageTime <= budget["time"] * (1 + timeTolerance)
+		memoryOk = stageMemory <= budget["bytesPerItem"] * (1 + memoryTolerance)
+		failures += not ( timeOk and memoryOk )
+		print( "\t>>> %-5s %-8s %8.4f units (budget %.4f)%s %8.1f bytes/item (budget %.1f)%s" % (
+			"ok" if timeOk and memoryOk else "FAIL", name, stageTime, budget["time"], "" if timeOk else " SLOW",
+			stageMemory, budget["bytesPerItem"], "" if memoryOk else " OVER" ) )
+
+	if update:
+		with open( BUDGETS, "w" ) as f:
+			json.dump( { "items": count, "stages": measured }, f, indent=2 )
+			f.write( "\n" )
+
+	print( "" )
+	return failures
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: Run the checks and report the results
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+if __name__ == "__main__":
+
+	parser = argparse.ArgumentParser( prog='regressionHarness.py', description='Check the converters for output and performance regressions')
+	parser.add_argument('-checks', required=False, nargs='+', default=['golden', 'perf'], choices=['golden', 'perf'], help='The checks to run.  Default = all of them')
+	parser.add_argument('-items', required=False, type=int, default=50000, help='The number of items in the synthetic transcript for the perf check.  Default = 50000')
+	parser.add_argument('-runs', required=False, type=int, default=7, help='The number of timed runs of each stage, the best one is used.  Default = 7')
+	parser.add_argument('-timetolerance', required=False, type=float, default=0.5, help='The fraction a stage may be slower than its budget.  Default = 0.5')
+	parser.add_argument('-memorytolerance', required=False, type=float, default=0.10, help='The fraction a stage may use more memory than its budget.  Default = 0.10')
+	parser.add_argument('-updategoldens', required=False, action='store_true', help='Save the current outputs as the golden files')
+	parser.add_argument('-updatebudgets', required=False, action='store_true', help='Save the current measurements as the budgets')
+	args = parser.parse_args()
+
+	failures = 0
+	if "golden" in args.checks:
+		failures += checkGoldens( args.updategoldens )
+	if "perf" in args.checks:
+		failures += checkPerformance( args.items, args.runs, args.timetolerance, args.memorytolerance, args.updatebudgets )
+
+	print( "==> %d check(s) failed\n" % failures )
+	sys.exit( 1 if failures else 0 )
@@ -0,0 +1,303 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# captionCore.py
+#
+# Purpose: The conversion core shared by all of the transcript converters.  The Transcribe
+#          items are grouped into phrases once, and the phrases are handed to a writer that
+#          renders them in one output format.  A phrase is:
+#
+#              { 'start_time': 'HH:MM:SS,mmm', 'end_time': 'HH:MM:SS,mmm',
+#                'words': [ ... ], 'types': [ 'pronunciation' | 'punctuation', ... ] }
+#
+#          Writers are registered by name with registerWriter().  The built-in ones (SRT, VTT,
+#          SSML, TTML/DFXP and JSON cues) are in captionWriters.py.  Other modules can register
+#          writers without any change here, by being listed in the AWSUTILITIES_WRITERS
+#          environment variable (comma separated module names), which are imported along with
+#          the built-in writers the first time a writer is looked up:
+#
+#              def getMyFormat( phrases, options ):
+#                  return ...
+#
+#              captionCore.registerWriter( "myformat", ".myf", getMyFormat )
+#
+#          The parse, phrases, text and write stages are marked for the -profile option of the
+#          converters, see profileHooks.py.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import codecs
+import os
+
+import profileHooks
+import s3Utils
+
+# transcriptReader and the writer modules are imported by the functions that
+# use them, so --help and small conversions don't pay for loading them
+
+
+# Number of items in each phrase
+PHRASE_LENGTH = 10
+
+# Languages written without spaces between words, by the primary subtag of the language code
+UNSPACED_LANGUAGES = [ "ja", "zh", "th", "lo", "km", "my" ]
+
+# Modules that register the built-in writers
+WRITER_MODULES = [ "captionWriters" ]
+
+# Registered writers: format name -> (file extension, render function)
+writers = {}
+writersLoaded = False
+
+
+
+# ==================================================================================
+# Function: newPhrase
+# Purpose: simply create a phrase tuple
+# Parameters:
+#                 None
+# ==================================================================================
+def newPhrase():
+	return { 'start_time': '', 'end_time': '', 'words' : [], 'types' : [] }
+
+
+# ==================================================================================
+# Function: getTimeCode
+# Purpose: Format and return a string that contains the converted number of seconds into SRT format
+# Parameters:
+#                 seconds - the duration in seconds to convert to HH:MM:SS,mmm
+#                 separator - the separator of the seconds and milliseconds.  Default = ","
+# ==================================================================================
+def getTimeCode( seconds, separator="," ):
+	# work in whole milliseconds, so binary fractions like 1.23 don't truncate to 1.229 and
+	# the hours, minutes and seconds are exact
+	t_millis = int( round( seconds * 1000 ) )
+	t_hund = t_millis % 1000
+	t_secs = ( t_millis // 1000 ) % 60
+	t_mins = ( t_millis // 60000 ) % 60
+	t_hours = t_millis // 3600000
+	return "%02d:%02d:%02d%s%03d" % (t_hours, t_mins, t_secs, separator, t_hund )
+
+
+# ==================================================================================
+# Function: getSeconds
+# Purpose: Return the number of seconds in an HH:MM:SS,mmm time code.  strptime can't be used
+#          for this, as it rejects the 24 hours and more of a long recording
+# Parameters:
+#                 timecode - the time code to convert
+# ==================================================================================
+def getSeconds( timecode ):
+	hms, millis = timecode.split( "," )
+	hours, mins, secs = hms.split( ":" )
+	return float( (int(millis)/1000 + int(secs)) + int(mins)*60 + int(hours)*3600 )
+
+
+# ==================================================================================
+# Function: getPhrasesFromTranscript
+# Purpose: Based on the JSON transcript provided by Amazon Transcribe, get the phrases from it
+# Parameters:
+#                 transcript - the JSON output from Amazon Transcribe, as a str, bytes or mmap
+#                 backend - the JSON backend to decode it with, see transcriptReader
+# ==================================================================================
+def getPhrasesFromTranscript( transcript, backend="auto" ):
+	import transcriptReader
+
+	with profileHooks.stage( "parse" ):
+		items = transcriptReader.parseItems( transcript, backend )
+
+	print ("==> Creating phrases from transcript...")
+
+	with profileHooks.stage( "phrases" ):
+		return getPhrasesFromItems( items )
+
+
+# ==================================================================================
+# Function: getPhrasesFromItems
+# Purpose: Group the Transcribe items into phrases of PHRASE_LENGTH items each
+# Parameters:
+#                 items - the results.items list from the Transcribe JSON output, or any
+#                         iterable of items in the same shape
+# ==================================================================================
+def getPhrasesFromItems( items ):
+	phrases = []
+	phrase = newPhrase()
+	words = phrase["words"]
+	types = phrase["types"]
+	end = None
+	x = 0
+
+	for item in items:
+		itemType = item["type"]
+
+		# Punctuation doesn't contain timing information, so the phrase starts at its first
+		# word and ends with its last one.  Only the raw end time is kept while the phrase
+		# grows, and turned into a time code once, when the phrase is complete
+		if itemType == "pronunciation":
+			if end is None:
+				phrase["start_time"] = getTimeCode( float(item["start_time"]) )
+			end = item["end_time"]
+
+		words.append( item["alternatives"][0]["content"] )
+		types.append( itemType )
+		x += 1
+
+		# now add the phrase to the phrases, generate a new phrase, etc.
+		if x == PHRASE_LENGTH:
+			if end is not None:
+				phrase["end_time"] = getTimeCode( float(end) )
+			phrases.append( phrase )
+
+			phrase = newPhrase()
+			words = phrase["words"]
+			types = phrase["types"]
+			end = None
+			x = 0
+
+	# keep the last words of the transcript, even when they don't make up a full phrase.  If only
+	# punctuation is left over, it has no timing of its own and belongs to the phrase before it,
+	# or is dropped when there is none, as a caption can't be timed without a word
+	if len(words) > 0:
+		if end is not None:
+			phrase["end_time"] = getTimeCode( float(end) )
+			phrases.append( phrase )
+		elif len(phrases) > 0:
+			phrases[-1]["words"].extend( words )
+			phrases[-1]["types"].extend( types )
+
+	return phrases
+
+
+# ==================================================================================
+# Function: getPhraseText
+# Purpose: For a given phrase, return the string of words including punctuation
+# Parameters:
+#                 phrase - the array of JSON tuples containing the words to show up as subtitles
+#                 lang - the language code of the transcript (e.g. "en", "ja-JP")
+# ==================================================================================
+def getPhraseText( phrase, lang='en' ):
+
+	# Japanese, Chinese and the like put no spaces between their words
+	if lang.lower().replace( "_", "-" ).split( "-" )[0] in UNSPACED_LANGUAGES:
+		return "".join( phrase["words"] )
+
+	# Use the Transcribe item type rather than looking at the characters of each word, so
+	# words in any language are spaced, and punctuation sticks to the word before it
+	out = "".join( [ word if wtype == "punctuation" else " " + word for word, wtype in zip(phrase["words"], phrase["types"]) ] )
+
+	# the first word never gets a leading space
+	if out and phrase["types"][0] != "punctuation":
+		out = out[1:]
+
+	return out
+
+
+# ==================================================================================
+# Function: registerWriter
+# Purpose: Register a writer for an output format, replacing any writer of the same name
+# Parameters:
+#                 name - the name of the format, e.g. "srt"
+#                 extension - the extension of its files, e.g. ".srt"
+#                 render - function( phrases, options ) returning the contents of the file as a
+#                          string.  options is a dict of the format's settings, e.g. fstyle
+# ==================================================================================
+def registerWriter( name, extension, render ):
+	writers[name] = ( extension, render )
+
+
+# ==================================================================================
+# Function: loadWriters
+# Purpose: Import the modules registering the built-in writers, and those listed in the
+#          AWSUTILITIES_WRITERS environment variable, once
+# Parameters:
+#                 None
+# ==================================================================================
+def loadWriters():
+	global writersLoaded
+
+	if writersLoaded:
+		return
+	writersLoaded = True
+
+	import importlib
+
+	extra = [ m.strip() for m in os.environ.get( "AWSUTILITIES_WRITERS", "" ).split(",") if m.strip() ]
+	for module in WRITER_MODULES + extra:
+		importlib.import_module( module )
+
+
+# ==================================================================================
+# Function: getWriterNames
+# Purpose: Return the sorted names of all of the registered formats
+# Parameters:
+#                 None
+# ==================================================================================
+def getWriterNames():
+	loadWriters()
+	return sorted( writers )
+
+
+# ==================================================================================
+# Function: getWriter
+# Purpose: Return the (extension, render function) of a registered format
+# Parameters:
+#                 name - the name of the format
+# ==================================================================================
+def getWriter( name ):
+	loadWriters()
+	if name not in writers:
+		raise ValueError( "Unknown output format: " + name + ".  Known formats: " + ", ".join(sorted(writers)) )
+	return writers[name]
+
+
+# ==================================================================================
+# Function: render
+# Purpose: Return the contents of a file of the phrases in the given format
+# Parameters:
+#                 phrases - the phrases to render
+#                 name - the name of the format
+#                 options - dict of the format's settings, e.g. { "fstyle": "A:middle" }
+# ==================================================================================
+def render( phrases, name, options=None ):
+	return getWriter( name )[1]( phrases, options or {} )
+
+
+# ==================================================================================
+# Function: writeCaptions
+# Purpose: Render the phrases in the given format, and write them to a local file or S3
+# Parameters:
+#                 phrases - the phrases to render
+#                 filename - the name of the output file, or s3://bucket/key
+#                 name - the name of the format
+#                 options - dict of the format's settings, e.g. { "fstyle": "A:middle" }
+# ==================================================================================
+def writeCaptions( phrases, filename, name, options=None ):
+	with profileHooks.stage( "text" ):
+		contents = render( phrases, name, options )
+
+	with profileHooks.stage( "write" ):
+		if s3Utils.isS3Uri( filename ):
+			# upload straight to S3, large files go up as a multipart upload
+			s3Utils.writeObject( filename, contents )
+			return
+
+		out = codecs.open( filename, "w+", "utf-8" )
+		out.write( contents )
+		out.close()
@@ -0,0 +1,188 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# captionWriters.py
+#
+# Purpose: The built-in writers of the conversion core, see captionCore.py.  Each one renders
+#          the phrases in one format, and is registered under its name.  Every writer takes the
+#          option lang, the language code of the transcript, which decides how its words are
+#          joined (see captionCore.getPhraseText):
+#
+#              srt        - SubRip
+#              vtt        - WebVTT, options: fstyle, the cue settings (e.g. "A:middle L:90%")
+#              ssml       - SSML for Amazon Polly, options: pcttimepad, the % of padding to add
+#                           to the MAX Duration (e.g. "1.0" = 100%)
+#              ttml, dfxp - Timed Text Markup Language, also declared as the xml:lang
+#              cues       - JSON, a list of cues with their start and end in seconds
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import captionCore
+from captionCore import getPhraseText, getSeconds
+
+
+
+# ==================================================================================
+# Function: escapeXML
+# Purpose: Escape the characters that would otherwise break an XML document (&, < and >)
+# Parameters:
+#                 text - the text to escape
+# ==================================================================================
+def escapeXML( text ):
+	# chained str.replace runs in C over the whole string, and is much faster than str.translate
+	# with multi-character replacements.  & has to go first so the other entities aren't re-escaped
+	return text.replace( "&", "&amp;" ).replace( "<", "&lt;" ).replace( ">", "&gt;" )
+
+
+# ==================================================================================
+# Function: getDotTimeCode
+# Purpose: Return an HH:MM:SS,mmm time code of a phrase as HH:MM:SS.mmm, as used by VTT and TTML
+# Parameters:
+#                 timecode - the time code to convert
+# ==================================================================================
+def getDotTimeCode( timecode ):
+	return timecode.replace( ",", "." )
+
+
+# ==================================================================================
+# Function: getSRT
+# Purpose: Iterate through the phrases and return the contents of the SRT file as a string
+# Parameters:
+#                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
+#                 lang - the language code of the text (e.g. "en")
+# ==================================================================================
+def getSRT( phrases, lang='en' ):
+	out = []
+	x = 1
+
+	for phrase in phrases:
+
+		# write out the phrase number
+		out.append( str(x) + "\n" )
+		x += 1
+
+		# write out the start and end time
+		out.append( phrase["start_time"] + " --> " + phrase["end_time"] + "\n" )
+
+		# write out the full phase.  Use spacing if it is a word, or punctuation without spacing
+		out.append( getPhraseText( phrase, lang ) + "\n\n" )
+
+	return "".join( out )
+
+
+# ==================================================================================
+# Function: getVTT
+# Purpose: Iterate through the phrases and return the contents of the VTT file as a string
+# Parameters:
+#                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
+#                 fstyle - the style for the subtitles to appear on screen (e.g. "A:middle L:90%")
+#                 lang - the language code of the text (e.g. "en")
+# ==================================================================================
+def getVTT( phrases, fstyle, lang='en' ):
+	x = 1
+
+	# write the header of the webVTT file
+	out = [ "WEBVTT\n\n" ]
+
+	for phrase in phrases:
+
+		# write out the phrase number
+		out.append( str(x) + "\n" )
+		x += 1
+
+		# write out the start and end time
+		out.append( getDotTimeCode( phrase["start_time"] ) + " --> " + getDotTimeCode( phrase["end_time"] ) + " " + fstyle + "\n" )
+
+		# write out the full phase.  Use spacing if it is a word, or punctuation without spacing
+		out.append( getPhraseText( phrase, lang ) + "\n\n" )
+
+	return "".join( out )
+
+
+# ==================================================================================
+# Function: getSSML
+# Purpose: Iterate through the phrases and return the contents of the SSML file as a string
+# Parameters:
+#                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
+#                 pcttimepad - the % of padding to add to the SSML MAX Duration (e.g. 1.0 = 100%)
+#                 lang - the language code of the text (e.g. "en")
+# ==================================================================================
+def getSSML( phrases, pcttimepad='1.0', lang='en' ):
+
+	# collect the lines of the document and join them once at the end
+	ssml = [ "<speak>\n" ]
+
+	for phrase in phrases:
+
+		#get the total seconds
+		totalseconds = (getSeconds( phrase["end_time"] ) - getSeconds( phrase["start_time"] )) * float(pcttimepad)
+
+		ssml.append( "<prosody amazon:max-duration=\"" + "%3.2f" % (totalseconds) +  "\">" + escapeXML( getPhraseText(phrase, lang) ) + "</prosody>\n" )
+
+	ssml.append( "</speak>" )
+
+	return "".join( ssml )
+
+
+# ==================================================================================
+# Function: getTTML
+# Purpose: Iterate through the phrases and return the contents of a TTML (DFXP) document
+# Parameters:
+#                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
+#                 lang - the language code of the text (e.g. "en")
+# ==================================================================================
+def getTTML( phrases, lang='en' ):
+	out = [ "<?xml version=\"1.0\" encoding=\"UTF-8\"?>\n",
+	        "<tt xmlns=\"http://www.w3.org/ns/ttml\" xml:lang=\"" + escapeXML( lang ) + "\">\n",
+	        "  <body>\n    <div>\n" ]
+
+	for phrase in phrases:
+		out.append( "      <p begin=\"" + getDotTimeCode( phrase["start_time"] ) + "\" end=\"" + getDotTimeCode( phrase["end_time"] ) + "\">"
+		            + escapeXML( getPhraseText(phrase, lang) ) + "</p>\n" )
+
+	out.append( "    </div>\n  </body>\n</tt>\n" )
+
+	return "".join( out )
+
+
+# ==================================================================================
+# Function: getJSONCues
+# Purpose: Return the phrases as a JSON document of cues, one cue per line
+# Parameters:
+#                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
+#                 lang - the language code of the text (e.g. "en")
+# ==================================================================================
+def getJSONCues( phrases, lang='en' ):
+	import json
+
+	cues = [ json.dumps( { "start": round( getSeconds(phrase["start_time"]), 3 ), "end": round( getSeconds(phrase["end_time"]), 3 ),
+	                       "text": getPhraseText( phrase, lang ) }, ensure_ascii=False ) for phrase in phrases ]
+
+	return "{ \"cues\": [\n" + ",\n".join( cues ) + "\n] }\n"
+
+
+
+captionCore.registerWriter( "srt", ".srt", lambda phrases, options: getSRT( phrases, options.get("lang", "en") ) )
+captionCore.registerWriter( "vtt", ".vtt", lambda phrases, options: getVTT( phrases, options.get("fstyle", ""), options.get("lang", "en") ) )
+captionCore.registerWriter( "ssml", ".ssml", lambda phrases, options: getSSML( phrases, options.get("pcttimepad", "1.0"), options.get("lang", "en") ) )
+captionCore.registerWriter( "ttml", ".ttml", lambda phrases, options: getTTML( phrases, options.get("lang", "en") ) )
+captionCore.registerWriter( "dfxp", ".dfxp", lambda phrases, options: getTTML( phrases, options.get("lang", "en") ) )
+captionCore.registerWriter( "cues", ".cues.json", lambda phrases, options: getJSONCues( phrases, options.get("lang", "en") ) )
@@ -30,39 +30,31 @@
 
 
 import argparse
-import time
-import json
-import codecs
-import re
+import sys
 
+import captionCore
+import profileHooks
+import s3Utils
 
+# The phrases are built, and written out, by the conversion core shared by all of the converters.
+# The functions that used to live here can still be imported from here
+from captionCore import newPhrase, getPhrasesFromTranscript, getPhrasesFromItems, getPhraseText  # noqa: F401
+from captionWriters import getVTT  # noqa: F401
 
+# transcriptReader and mergeTranscripts are imported by the functions that use them, so --help
+# and small conversions don't pay for loading them
 
-# ==================================================================================
-# Function: newPhrase
-# Purpose: simply create a phrase tuple
-# Parameters: 
-#                 None
-# ==================================================================================
-def newPhrase():
-	return { 'start_time': '', 'end_time': '', 'words' : [] }
 
 
-	
 # ==================================================================================
 # Function: getTimeCode
 # Purpose: Format and return a string that contains the converted number of seconds into VTT format
 # Parameters: 
-#                 seconds - the duration in seconds to convert to HH:MM:SS,mmm 
+#                 seconds - the duration in seconds to convert to HH:MM:SS.mmm
 # ==================================================================================	
-	# Format and return a string that contains the converted number of seconds into VTT format
 def getTimeCode( seconds ):
-	t_hund = int(seconds % 1 * 1000)
-	t_seconds = int( seconds )
-	t_secs = ((float( t_seconds) / 60) % 1) * 60
-	t_mins = int( t_seconds / 60 )
-	return str( "%02d:%02d:%02d.%03d" % (00, t_mins, int(t_secs), t_hund ))
-	
+	return captionCore.getTimeCode( seconds, "." )
+
 
 # ==================================================================================
 # Function: writeTranscriptToVTT
@@ -72,181 +64,140 @@ def getTimeCode( seconds ):
 #                 sourceLangCode - the language code for the original content (e.g. English = "EN")
 #                 VTTFileName - the name of the VTT file (e.g. "myVTT.VTT")
 # ==================================================================================	
-def writeTranscriptToVTT( transcript, sourceLangCode, VTTFileName, fstyle ):
+def writeTranscriptToVTT( transcript, sourceLangCode, VTTFileName, fstyle, backend="auto" ):
 	# Write the VTT file for the original language
 	print( "==> Creating VTT from transcript")
-	phrases = getPhrasesFromTranscript( transcript )
-	writeVTT( phrases, VTTFileName, fstyle )
+	phrases = getPhrasesFromTranscript( transcript, backend )
+	writeVTT( phrases, VTTFileName, fstyle, sourceLangCode )
 	
 # ==================================================================================
-# Function: getPhrasesFromTranscript
-# Purpose: Based on the JSON transcript provided by Amazon Transcribe, get the phrases from the translation 
-#          and write it out to an VTT file
+# Function: writeTranscriptPartsToVTT
+# Purpose: Function to merge the transcripts of the parts of one recording onto a single timeline,
+#          get the phrases from them and write it out to an VTT file
 # Parameters: 
-#                 transcript - the JSON output from Amazon Transcribe
-# ==================================================================================
-def getPhrasesFromTranscript( transcript ):
+#                 parts - the list of (transcript, offset) tuples, see mergeTranscripts.getParts
+#                 sourceLangCode - the language code for the original content (e.g. English = "EN")
+#                 VTTFileName - the name of the VTT file (e.g. "myVTT.VTT")
+#                 fstyle - the style for the subtitles to appear on screen (e.g. "A:middle L:90%")
+# ==================================================================================	
+def writeTranscriptPartsToVTT( parts, sourceLangCode, VTTFileName, fstyle, backend="auto" ):
+	print( "==> Creating VTT from %d transcript parts" % len(parts) )
 
-	# This function is intended to be called with the JSON structure output from the Transcribe service.  However,
-	# if you only have the translation of the transcript, then you should call getPhrasesFromTranslation instead
+	import mergeTranscripts
 
-	# Now create phrases from the translation
-	ts = json.loads( transcript )
-	items = ts['results']['items']
-	#print( items )
+	# the merged items are produced lazily, straight into the phrase builder
+	with profileHooks.stage( "phrases" ):
+		phrases = getPhrasesFromItems( mergeTranscripts.iterMergedItems( parts, backend ) )
+	writeVTT( phrases, VTTFileName, fstyle, sourceLangCode )
 	
-	#set up some variables for the first pass
-	phrase =  newPhrase()
-	phrases = []
-	nPhrase = True
-	x = 0
-	c = 0
-
-	print ("==> Creating phrases from transcript...")
-
-	for item in items:
-
-		# if it is a new phrase, then get the start_time of the first item
-		if nPhrase == True:
-			if item["type"] == "pronunciation":
-				phrase["start_time"] = getTimeCode( float(item["start_time"]) )
-				nPhrase = False
-			c+= 1
-		else:	
-			# get the end_time if the item is a pronuciation and store it
-			# We need to determine if this pronunciation or puncuation here
-			# Punctuation doesn't contain timing information, so we'll want
-			# to set the end_time to whatever the last word in the phrase is.
-			if item["type"] == "pronunciation":
-				phrase["end_time"] = getTimeCode( float(item["end_time"]) )
-				
-		# in either case, append the word to the phrase...
-		phrase["words"].append(item['alternatives'][0]["content"])
-		x += 1
-		
-		# now add the phrase to the phrases, generate a new phrase, etc.
-		if x == 10:
-			#print c, phrase
-			phrases.append(phrase)
-			phrase = newPhrase()
-			nPhrase = True
-			x = 0
-			
-	return phrases
-
 # ==================================================================================
 # Function: writeVTT
 # Purpose: Iterate through the phrases and write them to the VTT file
 # Parameters: 
 #                 phrases - the array of JSON tuples containing the phrases to show up as subtitles
 #                 filename - the name of the VTT output file (e.g. "myVTT.VTT")
+#                 fstyle - the style for the subtitles to appear on screen (e.g. "A:middle L:90%")
+#                 lang - the language code of the transcript (e.g. "en", "ja-JP")
 # ==================================================================================
-def writeVTT( phrases, filename, fstyle ):
+def writeVTT( phrases, filename, fstyle, lang='en' ):
 	print ("==> Writing phrases to disk...")
 
-	# open the files
-	e = codecs.open(filename,"w+", "utf-8")
-	x = 1
-	
-	# write the header of the webVTT file
-	e.write( "WEBVTT\n\n")
-	
-	for phrase in phrases:
-
-		# determine how many words are in the phrase
-		length = len(phrase["words"])
-		
-		# write out the phrase number
-		e.write( str(x) + "\n" )
-		x += 1
-		
-		# write out the start and end time
-		e.write( phrase["start_time"] + " --> " + phrase["end_time"] + " " + fstyle + "\n" )
-					
-		# write out the full phase.  Use spacing if it is a word, or punctuation without spacing
-		out = getPhraseText( phrase )
-
-		# write out the WebVTT file
-		e.write(out + "\n\n" )
-		
-	e.close()
+	# the file goes to local disk or S3, depending on its name
+	captionCore.writeCaptions( phrases, filename, "vtt", { "fstyle": fstyle, "lang": lang } )
 
 
 # ==================================================================================
-# Function: getPhraseText
-# Purpose: For a given phrase, return the string of words including punctuation
-# Parameters: 
-#                 phrase - the array of JSON tuples containing the words to show up as subtitles
+# Function: main function
+# Purpose: After processing arguments for the file names, read the transcription input file, and write it out to the designated VTT file   
+# Parameters: See arg parser arguments
+#                 
 # ==================================================================================
 
-def getPhraseText( phrase ):
-
-	length = len(phrase["words"])
-		
-	out = ""
-	for i in range( 0, length ):
-		if re.match( '[a-zA-Z0-9]', phrase["words"][i]):
-			if i > 0:
-				out += " " + phrase["words"][i]
-			else:
-				out += phrase["words"][i]
+def main( argv=None, prog='createVTTfromTranscriptionFile.py' ):
+
+	# Get the command line arguments and parse them
+	parser = argparse.ArgumentParser( prog=prog, description='Process a JSON transcription from AWS Transcribe and write it out to as an VTT file')
+	parser.add_argument('-transin', required=False, nargs='+', help='The transcription file, or s3://bucket/key, to process.  Several files are merged as the parts of one recording')
+	parser.add_argument('-offsets', required=False, nargs='+', type=float, help='The offset in seconds of each of the -transin parts on the merged timeline')
+	parser.add_argument('-manifest', required=False, help='A JSON manifest listing the transcript parts and their offsets, used instead of -transin')
+	parser.add_argument('-vttout', required=True, help='The VTT file, or s3://bucket/key, to output')		
+	parser.add_argument('-s3endpoint', required=False, default=None, help='The endpoint URL of an S3 compatible service to use for s3:// files.  Default = AWS S3')
+	parser.add_argument('-fstyle', required=True, help='The style for subtitles to appear on screen.  E.g. "A:middle L:90%%"')
+	parser.add_argument('-lang', required=False, default='en', help='The language code of the transcript, e.g. ja-JP.  Words of Japanese, Chinese, Thai, Lao, Khmer and Burmese are joined without spaces.  Default = en')
+	parser.add_argument('-json', required=False, default='auto', choices=['auto', 'orjson', 'simdjson', 'json'], help='The JSON backend to decode the transcript with.  Default = auto (the fastest installed)')
+	parser.add_argument('-profile', '--profile', required=False, nargs='*', default=None, choices=profileHooks.PROFILERS, help='Profile the conversion stages with sample, cprofile and/or memory (tracemalloc).  Default = sample')
+	parser.add_argument('-profileout', required=False, default=None, help='The prefix of the profile reports.  Default = the VTT file name + ".profile"')
+	parser.add_argument('-profiletop', required=False, type=int, default=20, help='The number of lines of code in the allocation report of each stage.  Default = 20')
+	args = parser.parse_args( argv )
+
+	if not args.transin and not args.manifest:
+		parser.error( "one of -transin or -manifest is required" )
+
+	# print out parameters and key header information for the user
+	print( "==> createVTTfromTranscriptionFile.py <===\n")
+	print( "==> Parameters: ")
+	print( "\t>>>Transcription File In: " + ", ".join( args.transin or [ args.manifest ] )  )
+	print( "\t>>>VTT File Out: " + args.vttout )
+	print( "\t>>>Format Style: " + args.fstyle )
+	print( "\t>>>Language: " + args.lang )
+	print( "\t>>>JSON Backend: " + args.json )
+
+
+	if args.s3endpoint:
+		s3Utils.configure( endpoint=args.s3endpoint )
+
+	if args.profile is not None:
+		# the reports go next to a local output file, or in the current directory for an S3 one
+		profileOut = args.vttout.rsplit( "/", 1 )[-1] if s3Utils.isS3Uri( args.vttout ) else args.vttout
+		profileHooks.start( args.profile, args.profileout or profileOut + ".profile", args.profiletop )
+
+	# the profile is written even when the conversion fails and exits
+	try:
+		if args.manifest or args.offsets is not None or len(args.transin) > 1:
+			# the transcripts are the parts of one recording, so merge them onto a single timeline;
+			# a single part with -offsets is merged too, so its offset is applied
+			import mergeTranscripts
+
+			try:
+				parts = mergeTranscripts.getParts( args.transin, args.offsets, args.manifest )
+				for name, offset in parts:
+					print( "\t>>>Part: " + name + " (offset %.3fs)" % offset )
+
+				print( "\n==> Process Transcript Parts\n")
+				writeTranscriptPartsToVTT( parts, args.lang, args.vttout, args.fstyle, backend=args.json )
+
+			except (IOError, ValueError) as error:
+				# Could not read or merge the parts, exit gracefully
+				print(error)
+				sys.exit(-1)
+
 		else:
-			out += phrase["words"][i]
-			
-	return out
+			import transcriptReader
 
+			transinFile = args.transin[0]
 
+			#read the input file
+			print( "\n==> Reading " + transinFile + "\n")
 
-# ==================================================================================
-# Function: main function
-# Purpose: After processing arguments for the file names, read the transcription input file, and write it out to the designated VTT file   
-# Parameters: See arg parser arguments
-#                 
-# ==================================================================================
+			try:
+				# Local files are memory-mapped, and S3 objects read straight into memory rather
+				# than staging a copy on disk
+				with transcriptReader.openTranscript( transinFile ) as transin:
+					print( "\t>>> Read successful\n" )
 
-# Get the command line arguments and parse them
-parser = argparse.ArgumentParser( prog='createVTTfromTranscriptionFile.py', description='Process a JSON transcription from AWS Transcribe and write it out to as an VTT file')
-parser.add_argument('-transin', required=True, help='The transcription file to process')
-parser.add_argument('-vttout', required=True, help='The VTT file to output')		
-parser.add_argument('-fstyle', required=True, help='The style for subtitles to appear on screen.  E.g. "A:middle L:90%"')
-args = parser.parse_args()
-
-# print out parameters and key header information for the user
-print( "==> createVTTfromTranscriptionFile.py <===\n")
-print( "==> Parameters: ")
-print( "\t>>>Transcription File In: " + args.transin  )
-print( "\t>>>VTT File Out: " + args.vttout )
-print( "\t>>>Format Style: " + args.fstyle )
-
-
-#read the input file
-print( "\n==> Reading " + args.transin + "\n")
-
-try:
-	# Open a file for reading the output as a binary stream
-	with open(args.transin, "r") as tfile:
-		transin = tfile.read()
-	print( "\t>>> Read successful" )
-	print( "\t>>> Closing " + args.transin)		
-	tfile.close()
-		
-	if tfile.closed:
-		print( "\t>>>", args.transin, " is closed\n")
-	else:
-		print( "\t>>>", args.transin, " is NOT closed\n")
-	
-except IOError as error:
-	# Could not read to file, exit gracefully
-	print(error)
-	sys.exit(-1)
-		
-print( "==> Process Transcript\n")
-# Now get the t# Create the VTT File for the original transcript and write it out.  
-writeTranscriptToVTT( transin, 'en', args.vttout, args.fstyle )  
-print( "\n==> Processing Complete\n")
-	
+					print( "==> Process Transcript\n")
+					# Now get the phrases, and create the VTT file for the original transcript and write it out
+					writeTranscriptToVTT( transin, args.lang, args.vttout, args.fstyle, args.json )
 
+			except IOError as error:
+				# Could not read to file, exit gracefully
+				print(error)
+				sys.exit(-1)
+	finally:
+		profileHooks.stop()
 
+	print( "\n==> Processing Complete\n")
 
 
-		
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,642 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# jobQueue.py
+#
+# Purpose: A local, SQLite backed job queue in front of the converters, so the conversion
+#          boxes can be shared by several teams.  Each job converts one transcript into one or
+#          more formats, like batchConvert.py, and the queue survives restarts of the workers.
+#
+#              submit      - queue transcripts for a tenant (team), at a priority
+#              work        - run a bounded pool of worker processes over the queue
+#              stats       - print the queue depth and wait time metrics
+#              deadletters - list the jobs that failed for good
+#              requeue     - put dead jobs back on the queue
+#              tenant      - set the fair share weight of a tenant
+#
+#          Scheduling: the highest priority ready job always runs first, so interactive
+#          requests (-priority interactive) never wait behind a backfill.  Within a priority,
+#          the tenant that has used the least worker time, relative to its weight, goes
+#          next, and its jobs run in the order they were submitted.  A tenant that was idle
+#          can't bank its unused share: it rejoins level with the least served tenant
+#          that is still active.  Workers can be reserved (-reserved) for jobs at or
+#          above -urgent, so an interactive job never waits for a long backfill to finish.
+#
+#          Failures: a job is claimed under a lease that its worker keeps renewing.  A job
+#          whose worker died is picked up again when its lease expires.  Failed reads and
+#          writes (IOError) are retried with an exponential back-off, up to -maxattempts;
+#          other errors, e.g. a malformed transcript, and jobs out of attempts go straight to
+#          the dead letters, with their error, until they are requeued.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+
+import s3Utils
+
+# sqlite3, json, multiprocessing and the conversion modules are imported where they are
+# used, so -h doesn't pay for loading them
+
+# Named priorities, a higher priority runs first
+PRIORITIES = { "interactive": 10, "normal": 5, "backfill": 0 }
+
+# Seconds a claimed job stays leased to its worker without being renewed
+LEASE_SECONDS = 60.0
+
+# Seconds before the first retry of a failed job, doubled on every further attempt
+RETRY_BACKOFF = 5.0
+
+# Weight of the latest run in a tenant's average job duration, used to charge a job up front
+DURATION_SMOOTHING = 0.2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+	id INTEGER PRIMARY KEY AUTOINCREMENT,
+	tenant TEXT NOT NULL,
+	priority INTEGER NOT NULL,
+	transcript TEXT NOT NULL,
+	outdir TEXT NOT NULL,
+	formats TEXT NOT NULL,
+	options TEXT NOT NULL,
+	state TEXT NOT NULL,
+	attempts INTEGER NOT NULL DEFAULT 0,
+	max_attempts INTEGER NOT NULL,
+	submitted REAL NOT NULL,
+	available REAL NOT NULL,
+	started REAL,
+	waited REAL,
+	lease_until REAL,
+	finished REAL,
+	charged REAL NOT NULL DEFAULT 0,
+	worker TEXT,
+	error TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_ready ON jobs ( state, priority, tenant, id );
+CREATE INDEX IF NOT EXISTS jobs_tenant ON jobs ( tenant, state );
+CREATE INDEX IF NOT EXISTS jobs_started ON jobs ( started );
+CREATE TABLE IF NOT EXISTS tenants (
+	tenant TEXT PRIMARY KEY,
+	weight REAL NOT NULL DEFAULT 1.0,
+	usage REAL NOT NULL DEFAULT 0.0,
+	avg_seconds REAL NOT NULL DEFAULT 1.0
+);
+"""
+
+
+
+# ==================================================================================
+# Function: connect
+# Purpose: Open the queue database, creating it if needed.  Transactions are explicit, and
+#          the write-ahead log lets the stats and the workers read while a job is claimed
+# Parameters:
+#                 db - the SQLite database file of the queue
+# ==================================================================================
+def connect( db ):
+	import sqlite3
+
+	conn = sqlite3.connect( db, timeout=30.0, isolation_level=None )
+	conn.row_factory = sqlite3.Row
+	conn.execute( "PRAGMA journal_mode=WAL" )
+	conn.execute( "PRAGMA synchronous=NORMAL" )
+	conn.executescript( SCHEMA )
+	return conn
+
+
+# ==================================================================================
+# Function: transaction
+# Purpose: Context manager running the with block as one write transaction.  BEGIN IMMEDIATE
+#          takes the write lock up front, so two workers can't claim the same job
+# Parameters:
+#                 conn - the queue database connection
+# ==================================================================================
+@contextlib.contextmanager
+def transaction( conn ):
+	conn.execute( "BEGIN IMMEDIATE" )
+	try:
+		yield conn
+	except BaseException:
+		conn.execute( "ROLLBACK" )
+		raise
+	conn.execute( "COMMIT" )
+
+
+# ==================================================================================
+# Function: getPriority
+# Purpose: Return the number of a priority given by name (interactive, normal, backfill) or
+#          as a number, for argparse
+# Parameters:
+#                 value - the priority from the command line
+# ==================================================================================
+def getPriority( value ):
+	if value in PRIORITIES:
+		return PRIORITIES[value]
+	try:
+		return int( value )
+	except ValueError:
+		raise argparse.ArgumentTypeError( "must be a number or one of " + ", ".join(PRIORITIES) )
+
+
+# ==================================================================================
+# Function: getWeight
+# Purpose: Return a tenant weight from the command line, which must be a number above zero,
+#          for argparse
+# Parameters:
+#                 value - the weight from the command line
+# ==================================================================================
+def getWeight( value ):
+	try:
+		weight = float( value )
+	except ValueError:
+		raise argparse.ArgumentTypeError( "must be a number" )
+	# a weight of 0 would divide the usage by zero, and that tenant would always come first
+	if not 0 < weight < float( "inf" ):
+		raise argparse.ArgumentTypeError( "must be greater than 0" )
+	return weight
+
+
+# ==================================================================================
+# Function: submitJobs
+# Purpose: Queue one job per transcript, and return their ids
+# Parameters:
+#                 conn - the queue database connection
+#                 files - the transcript files, or s3://bucket/key URIs, to convert
+#                 outdir - the directory, or s3://bucket/prefix/, to write the outputs to
+#                 formats - the list of output formats, see captionCore.getWriterNames
+#                 options - dict of fstyle, pcttimepad, lang and json (the JSON backend)
+#                 tenant - the team the jobs are run for
+#                 priority - the priority of the jobs, higher runs first
+#                 maxAttempts - the number of times a job is tried before it is a dead letter
+# ==================================================================================
+def submitJobs( conn, files, outdir, formats, options, tenant, priority, maxAttempts ):
+	import json
+
+	now = time.time()
+	ids = []
+
+	# the workers may run in another directory
+	files = [ f if s3Utils.isS3Uri(f) else os.path.abspath(f) for f in files ]
+	if not s3Utils.isS3Uri( outdir ):
+		outdir = os.path.abspath( outdir )
+
+	with transaction( conn ):
+		conn.execute( "INSERT OR IGNORE INTO tenants ( tenant ) VALUES ( ? )", ( tenant, ) )
+
+		# a tenant coming back from idle starts level with the least served active tenant,
+		# rather than with all of the share it didn't use while it was away
+		if conn.execute( "SELECT COUNT(*) FROM jobs WHERE tenant = ? AND state IN ('queued', 'running')", ( tenant, ) ).fetchone()[0] == 0:
+			conn.execute( "UPDATE tenants SET usage = MAX( usage, weight * ( SELECT MIN(t.usage / t.weight) FROM tenants t WHERE EXISTS "
+			              "( SELECT 1 FROM jobs j WHERE j.tenant = t.tenant AND j.state IN ('queued', 'running') ) ) ) "
+			              "WHERE tenant = ? AND EXISTS ( SELECT 1 FROM jobs WHERE state IN ('queued', 'running') )", ( tenant, ) )
+
+		for f in files:
+			cursor = conn.execute( "INSERT INTO jobs ( tenant, priority, transcript, outdir, formats, options, state, max_attempts, submitted, available ) "
+			                       "VALUES ( ?, ?, ?, ?, ?, ?, 'queued', ?, ?, ? )",
+			                       ( tenant, priority, f, outdir, ",".join(formats), json.dumps(options), maxAttempts, now, now ) )
+			ids.append( cursor.lastrowid )
+	return ids
+
+
+# ==================================================================================
+# Function: expireLeases
+# Purpose: Return the jobs whose worker stopped renewing their lease to the queue, or to the
+#          dead letters when they are out of attempts.  Runs inside the claim transaction
+# Parameters:
+#                 conn - the queue database connection
+#                 now - the current time
+# ==================================================================================
+def expireLeases( conn, now ):
+	conn.execute( "UPDATE jobs SET state = CASE WHEN attempts >= max_attempts THEN 'dead' ELSE 'queued' END, "
+	              "available = ?, finished = CASE WHEN attempts >= max_attempts THEN ? END, error = 'lease expired on ' || worker "
+	              "WHERE state = 'running' AND lease_until < ?", ( now, now, now ) )
+
+
+# ==================================================================================
+# Function: claimJob
+# Purpose: Take the next job off the queue for a worker, or return None if none is ready.
+#          The highest priority goes first, then the tenant with the least weighted usage,
+#          then the oldest job of that tenant
+# Parameters:
+#                 conn - the queue database connection
+#                 worker - the name of the worker claiming the job
+#                 minPriority - the lowest priority of job this worker takes
+#                 lease - the seconds the job is leased to the worker
+# ==================================================================================
+def claimJob( conn, worker, minPriority=None, lease=LEASE_SECONDS ):
+	now = time.time()
+	floor = -sys.maxsize if minPriority is None else minPriority
+
+	with transaction( conn ):
+		expireLeases( conn, now )
+
+		# walks the ready index down from the top priority, and stops at the first ready job
+		top = conn.execute( "SELECT priority FROM jobs WHERE state = 'queued' AND available <= ? AND priority >= ? ORDER BY priority DESC LIMIT 1",
+		                    ( now, floor ) ).fetchone()
+		if top is None:
+			return None
+		priority = top[0]
+
+		tenant = conn.execute( "SELECT t.tenant, t.weight, t.usage, t.avg_seconds FROM tenants t "
+		                       "WHERE EXISTS ( SELECT 1 FROM jobs j WHERE j.tenant = t.tenant AND j.state = 'queued' AND j.priority = ? AND j.available <= ? ) "
+		                       "ORDER BY t.usage / t.weight, t.tenant LIMIT 1", ( priority, now ) ).fetchone()
+
+		job = conn.execute( "SELECT * FROM jobs WHERE state = 'queued' AND priority = ? AND tenant = ? AND available <= ? ORDER BY id LIMIT 1",
+		                    ( priority, tenant["tenant"], now ) ).fetchone()
+
+		# charge the tenant its average job duration now, so the other workers claiming in the
+		# meantime see the share it is using.  The difference is settled when the job finishes
+		charge = tenant["avg_seconds"]
+		conn.execute( "UPDATE tenants SET usage = usage + ? WHERE tenant = ?", ( charge, tenant["tenant"] ) )
+		conn.execute( "UPDATE jobs SET state = 'running', attempts = attempts + 1, started = ?, waited = COALESCE(waited, ? - submitted), "
+		              "lease_until = ?, charged = ?, worker = ? WHERE id = ?", ( now, now, now + lease, charge, worker, job["id"] ) )
+
+	return dict( job, attempts=job["attempts"] + 1, started=now, charged=charge, worker=worker,
+	             waited=job["waited"] if job["waited"] is not None else now - job["submitted"] )
+
+
+# ==================================================================================
+# Function: renewLease
+# Purpose: Extend the lease of a running job, returning False if the worker lost it
+# Parameters:
+#                 conn - the queue database connection
+#                 job - the job being run
+#                 worker - the name of the worker running it
+#                 lease - the seconds to extend the lease by
+# ==================================================================================
+def renewLease( conn, job, worker, lease=LEASE_SECONDS ):
+	with transaction( conn ):
+		cursor = conn.execute( "UPDATE jobs SET lease_until = ? WHERE id = ? AND state = 'running' AND worker = ?",
+		                       ( time.time() + lease, job["id"], worker ) )
+	return cursor.rowcount == 1
+
+
+# ==================================================================================
+# Function: finishJob
+# Purpose: Record the outcome of a job.  A failed job is retried later if the error may be
+#          temporary and it has attempts left, otherwise it becomes a dead letter
+# Parameters:
+#                 conn - the queue database connection
+#                 job - the job that was run, as returned by claimJob
+#                 error - the exception it failed with, or None if it succeeded
+#                 backoff - the seconds before the first retry, doubled on every attempt
+# ==================================================================================
+def finishJob( conn, job, error=None, backoff=RETRY_BACKOFF ):
+	now = time.time()
+	duration = now - job["started"]
+
+	with transaction( conn ):
+		# only while the job is still this worker's, it may have lost the lease and been claimed again
+		owned = " WHERE id = ? AND state = 'running' AND worker = ?"
+		if error is None:
+			cursor = conn.execute( "UPDATE jobs SET state = 'done', finished = ?, error = NULL" + owned, ( now, job["id"], job["worker"] ) )
+		elif isinstance( error, IOError ) and job["attempts"] < job["max_attempts"]:
+			cursor = conn.execute( "UPDATE jobs SET state = 'queued', available = ?, error = ?" + owned,
+			                       ( now + backoff * 2 ** (job["attempts"] - 1), str(error), job["id"], job["worker"] ) )
+		else:
+			cursor = conn.execute( "UPDATE jobs SET state = 'dead', finished = ?, error = ?" + owned,
+			                       ( now, type(error).__name__ + ": " + str(error), job["id"], job["worker"] ) )
+
+		# settle the tenant's usage with what the job really took.  A job that was lost has
+		# already been charged again by the claim that took it over, so it is left to that one
+		if cursor.rowcount == 1:
+			conn.execute( "UPDATE tenants SET usage = usage + ? - ?, avg_seconds = avg_seconds + ? * ( ? - avg_seconds ) WHERE tenant = ?",
+			              ( duration, job["charged"], DURATION_SMOOTHING, duration, job["tenant"] ) )
+
+
+# ==================================================================================
+# Function: runJob
+# Purpose: Convert the transcript of a job into each of its formats
+# Parameters:
+#                 job - the job to run, as returned by claimJob
+# ==================================================================================
+def runJob( job ):
+	import json
+	import batchConvert
+	import transcriptReader
+
+	formats = job["formats"].split( "," )
+	options = json.loads( job["options"] )
+
+	with transcriptReader.openTranscript( job["transcript"] ) as transcript:
+		outputs = batchConvert.convertTranscript( transcript, formats, options.get("fstyle", ""), options.get("pcttimepad", "1.0"), options.get("json", "auto"), options.get("lang", "en") )
+
+	if not s3Utils.isS3Uri( job["outdir"] ):
+		os.makedirs( job["outdir"], exist_ok=True )
+
+	for fmt in formats:
+		batchConvert.writeFile( batchConvert.getOutputName( job["transcript"], job["outdir"], fmt ), outputs[fmt] )
+
+
+# ==================================================================================
+# Function: isIdle
+# Purpose: Return True if there is nothing left that a worker could take: no job waiting, and
+#          no job running that might still be retried
+# Parameters:
+#                 conn - the queue database connection
+#                 minPriority - the lowest priority of job the worker takes
+# ==================================================================================
+def isIdle( conn, minPriority=None ):
+	floor = -sys.maxsize if minPriority is None else minPriority
+	return conn.execute( "SELECT COUNT(*) FROM jobs WHERE state IN ('queued', 'running') AND priority >= ?", ( floor, ) ).fetchone()[0] == 0
+
+
+# ==================================================================================
+# Function: runWorker
+# Purpose: The loop of one worker process: claim a job, run it while renewing its lease, and
+#          record the outcome, until stopped
+# Parameters:
+#                 db - the SQLite database file of the queue
+#                 worker - the name of this worker
+#                 minPriority - the lowest priority of job this worker takes, None for all
+#                 poll - the seconds to wait when no job is ready
+#                 drain - exit once the queue is empty rather than wait for more jobs
+#                 stop - a multiprocessing.Event that tells the worker to exit
+#                 endpoint - the endpoint URL of an S3 compatible service, or None
+# ==================================================================================
+def runWorker( db, worker, minPriority, poll, drain, stop, endpoint=None ):
+	import threading
+
+	s3Utils.configure( endpoint=endpoint )
+	conn = connect( db )
+
+	while not stop.is_set():
+		job = claimJob( conn, worker, minPriority )
+		if job is None:
+			if drain and isIdle( conn, minPriority ):
+				break
+			stop.wait( poll )
+			continue
+
+		# keep the lease alive from a thread, with its own connection, while the job runs
+		done = threading.Event()
+
+		def keepLease( job=job, done=done ):
+			leaseConn = connect( db )
+			while not done.wait( LEASE_SECONDS / 3 ):
+				renewLease( leaseConn, job, worker )
+			leaseConn.close()
+
+		renewer = threading.Thread( target=keepLease, daemon=True )
+		renewer.start()
+
+		error = None
+		try:
+			runJob( job )
+		except Exception as e:
+			error = e
+		finally:
+			done.set()
+			renewer.join()
+
+		finishJob( conn, job, error )
+		print( "\t>>> %s: job %d (%s, priority %d) %s after waiting %.2fs, in %.2fs" % (worker, job["id"], job["tenant"], job["priority"],
+		       "done" if error is None else "FAILED (" + str(error) + ")", job["waited"], time.time() - job["started"]) )
+		sys.stdout.flush()
+
+	conn.close()
+
+
+# ==================================================================================
+# Function: runWorkers
+# Purpose: Run a bounded pool of worker processes over the queue until they are all done, or
+#          interrupted
+# Parameters:
+#                 db - the SQLite database file of the queue
+#                 workers - the number of worker processes
+#                 reserved - how many of them only take jobs at or above the urgent priority
+#                 urgent - the lowest priority the reserved workers take
+#                 poll - the seconds a worker waits when no job is ready
+#                 drain - exit once the queue is empty rather than wait for more jobs
+#                 endpoint - the endpoint URL of an S3 compatible service, or None
+# ==================================================================================
+def runWorkers( db, workers, reserved, urgent, poll, drain, endpoint=None ):
+	import multiprocessing
+
+	# create the database before the workers race to
+	connect( db ).close()
+
+	stop = multiprocessing.Event()
+	processes = []
+	for x in range( 0, workers ):
+		minPriority = urgent if x < reserved else None
+		name = "worker-%d-%d" % (os.getpid(), x + 1)
+		processes.append( multiprocessing.Process( target=runWorker, args=( db, name, minPriority, poll, drain, stop, endpoint ) ) )
+
+	for p in processes:
+		p.start()
+
+	try:
+		for p in processes:
+			p.join()
+	except KeyboardInterrupt:
+		# let the running jobs finish, the queue keeps everything else
+		print( "\n==> Stopping after the running jobs...\n" )
+		stop.set()
+		for p in processes:
+			p.join()
+
+
+# ==================================================================================
+# Function: getPercentile
+# Purpose: Return a percentile of a sorted list of numbers
+# Parameters:
+#                 values - the sorted numbers
+#                 pct - the percentile, 0 to 100
+# ==================================================================================
+def getPercentile( values, pct ):
+	if not values:
+		return 0.0
+	return values[ min( len(values) - 1, int( round( pct / 100.0 * (len(values) - 1) ) ) ) ]
+
+
+# ==================================================================================
+# Function: getMetrics
+# Purpose: Return the queue depth per state, priority and tenant, and the wait times of the
+#          jobs started in the last window seconds per priority
+# Parameters:
+#                 conn - the queue database connection
+#                 window - the seconds of history the wait times are taken over
+# ==================================================================================
+def getMetrics( conn, window=3600.0 ):
+	now = time.time()
+	metrics = { "depth": [], "tenants": [], "waits": [], "oldest_queued": 0.0 }
+
+	for row in conn.execute( "SELECT priority, state, COUNT(*) AS jobs FROM jobs GROUP BY priority, state ORDER BY priority DESC, state" ):
+		metrics["depth"].append( dict(row) )
+
+	for row in conn.execute( "SELECT t.tenant, t.weight, t.usage, "
+	                         "SUM(j.state = 'queued') AS queued, SUM(j.state = 'running') AS running, "
+	                         "SUM(j.state = 'done') AS done, SUM(j.state = 'dead') AS dead "
+	                         "FROM tenants t LEFT JOIN jobs j ON j.tenant = t.tenant GROUP BY t.tenant ORDER BY t.tenant" ):
+		metrics["tenants"].append( dict(row) )
+
+	oldest = conn.execute( "SELECT MIN(submitted) FROM jobs WHERE state = 'queued'" ).fetchone()[0]
+	if oldest is not None:
+		metrics["oldest_queued"] = now - oldest
+
+	waits = {}
+	for row in conn.execute( "SELECT priority, waited FROM jobs WHERE started >= ? AND waited IS NOT NULL", ( now - window, ) ):
+		waits.setdefault( row["priority"], [] ).append( row["waited"] )
+
+	for priority in sorted( waits, reverse=True ):
+		values = sorted( waits[priority] )
+		metrics["waits"].append( { "priority": priority, "jobs": len(values), "mean": sum(values) / len(values),
+		                           "p50": getPercentile(values, 50), "p95": getPercentile(values, 95), "max": values[-1] } )
+
+	return metrics
+
+
+# ==================================================================================
+# Function: printMetrics
+# Purpose: Print the metrics of getMetrics for the user
+# Parameters:
+#                 metrics - the metrics to print
+#                 window - the seconds of history the wait times were taken over
+# ==================================================================================
+def printMetrics( metrics, window ):
+	print( "==> Queue depth\n" )
+	for row in metrics["depth"]:
+		print( "\t>>> priority %4d  %-8s %8d" % (row["priority"], row["state"], row["jobs"]) )
+	print( "\t>>> oldest queued job: %.1fs\n" % metrics["oldest_queued"] )
+
+	print( "==> Tenants\n" )
+	for row in metrics["tenants"]:
+		print( "\t>>> %-20s weight %5.2f  usage %10.1fs  queued %6d  running %4d  done %8d  dead %6d" % (row["tenant"], row["weight"], row["usage"],
+		       row["queued"] or 0, row["running"] or 0, row["done"] or 0, row["dead"] or 0) )
+
+	print( "\n==> Wait times of the jobs started in the last %ds\n" % window )
+	for row in metrics["waits"]:
+		print( "\t>>> priority %4d  %6d jobs  mean %8.2fs  p50 %8.2fs  p95 %8.2fs  max %8.2fs" % (row["priority"], row["jobs"], row["mean"],
+		       row["p50"], row["p95"], row["max"]) )
+	print( "" )
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: After processing arguments, run the queue command
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+
+def main( argv=None, prog='jobQueue.py' ):
+
+	# Get the command line arguments and parse them
+	parser = argparse.ArgumentParser( prog=prog, description='A persistent job queue of transcript conversions, with priorities and per-tenant fair sharing')
+	parser.add_argument('-db', required=False, default='jobqueue.db', help='The SQLite database file of the queue.  Default = jobqueue.db')
+	commands = parser.add_subparsers( dest='command', metavar='command' )
+	commands.required = True
+
+	submit = commands.add_parser( 'submit', help='Queue transcripts to convert' )
+	submit.add_argument('-transin', required=True, nargs='+', help='The transcription files, directories or s3://bucket/prefix/ of them, to convert')
+	submit.add_argument('-outdir', required=True, help='The directory, or s3://bucket/prefix/, to write the output files to')
+	submit.add_argument('-formats', required=False, nargs='+', default=['srt'], help='The output formats to create.  Default = srt')
+	submit.add_argument('-tenant', required=False, default='default', help='The team the jobs are run for.  Default = default')
+	submit.add_argument('-priority', required=False, type=getPriority, default=PRIORITIES["normal"], help='interactive, normal, backfill or a number, higher runs first.  Default = normal')
+	submit.add_argument('-maxattempts', required=False, type=int, default=3, help='The number of times a job is tried before it is a dead letter.  Default = 3')
+	submit.add_argument('-fstyle', required=False, default='', help='The style for VTT subtitles to appear on screen.  E.g. "A:middle L:90%%"')
+	submit.add_argument('-pcttimepad', required=False, default='1.0', help='The %% of padding to add to the SSML MAX Duration.  Default = 1 (100%%)')
+	submit.add_argument('-lang', required=False, default='en', help='The language code of the transcripts, e.g. ja-JP.  Default = en')
+	submit.add_argument('-json', required=False, default='auto', choices=['auto', 'orjson', 'simdjson', 'json'], help='The JSON backend to decode the transcripts with.  Default = auto (the fastest installed)')
+
+	work = commands.add_parser( 'work', help='Run a pool of workers over the queue' )
+	work.add_argument('-workers', required=False, type=int, default=os.cpu_count(), help='The number of worker processes.  Default = number of CPUs')
+	work.add_argument('-reserved', required=False, type=int, default=0, help='The number of workers that only take jobs at or above -urgent.  Default = 0')
+	work.add_argument('-urgent', required=False, type=getPriority, default=PRIORITIES["interactive"], help='The lowest priority the reserved workers take.  Default = interactive')
+	work.add_argument('-poll', required=False, type=float, default=1.0, help='The seconds a worker waits when no job is ready.  Default = 1')
+	work.add_argument('-drain', required=False, action='store_true', help='Exit once the queue is empty, rather than wait for more jobs')
+	work.add_argument('-s3endpoint', required=False, default=None, help='The endpoint URL of an S3 compatible service to use for s3:// files.  Default = AWS S3')
+
+	stats = commands.add_parser( 'stats', help='Print the queue depth and wait time metrics' )
+	stats.add_argument('-window', required=False, type=float, default=3600.0, help='The seconds of history the wait times are taken over.  Default = 3600')
+	stats.add_argument('-asjson', required=False, action='store_true', help='Print the metrics as JSON')
+
+	commands.add_parser( 'deadletters', help='List the jobs that failed for good' )
+
+	requeue = commands.add_parser( 'requeue', help='Put dead jobs back on the queue' )
+	requeue.add_argument('-ids', required=False, nargs='+', type=int, default=None, help='The jobs to requeue.  Default = all of the dead jobs')
+
+	tenant = commands.add_parser( 'tenant', help='Set the fair share weight of a tenant' )
+	tenant.add_argument('-name', required=True, help='The tenant')
+	tenant.add_argument('-weight', required=True, type=getWeight, help='Its share of the workers relative to the other tenants, e.g. 2 = twice the default')
+
+	args = parser.parse_args( argv )
+
+	if args.command == 'work':
+		if args.reserved >= args.workers:
+			parser.error( "-reserved must leave at least one worker for the other jobs" )
+		print( "==> %s: %d workers (%d reserved for priority %d and above) on %s\n" % (prog, args.workers, args.reserved, args.urgent, args.db) )
+		runWorkers( args.db, args.workers, args.reserved, args.urgent, args.poll, args.drain, args.s3endpoint )
+		return
+
+	conn = connect( args.db )
+
+	if args.command == 'submit':
+		import batchConvert
+		import captionCore
+
+		for fmt in args.formats:
+			try:
+				captionCore.getWriter( fmt )
+			except ValueError as error:
+				parser.error( str(error) )
+
+		files = batchConvert.getTranscriptFiles( args.transin )
+		options = { "fstyle": args.fstyle, "pcttimepad": args.pcttimepad, "lang": args.lang, "json": args.json }
+		ids = submitJobs( conn, files, args.outdir, args.formats, options, args.tenant, args.priority, args.maxattempts )
+		if ids:
+			print( "==> Queued %d jobs (%d-%d) for %s at priority %d" % (len(ids), ids[0], ids[-1], args.tenant, args.priority) )
+
+	elif args.command == 'stats':
+		metrics = getMetrics( conn, args.window )
+		if args.asjson:
+			import json
+			print( json.dumps( metrics, indent=2 ) )
+		else:
+			printMetrics( metrics, args.window )
+
+	elif args.command == 'deadletters':
+		for row in conn.execute( "SELECT id, tenant, priority, transcript, attempts, error FROM jobs WHERE state = 'dead' ORDER BY id" ):
+			print( "\t>>> job %d (%s, priority %d) %s after %d attempts: %s" % (row["id"], row["tenant"], row["priority"], row["transcript"], row["attempts"], row["error"]) )
+
+	elif args.command == 'requeue':
+		query = "UPDATE jobs SET state = 'queued', attempts = 0, available = ?, finished = NULL WHERE state = 'dead'"
+		params = [ time.time() ]
+		if args.ids:
+			query += " AND id IN (" + ",".join( "?" * len(args.ids) ) + ")"
+			params += args.ids
+		with transaction( conn ):
+			count = conn.execute( query, params ).rowcount
+		print( "==> Requeued %d jobs" % count )
+
+	elif args.command == 'tenant':
+		with transaction( conn ):
+			conn.execute( "INSERT OR IGNORE INTO tenants ( tenant ) VALUES ( ? )", ( args.name, ) )
+			conn.execute( "UPDATE tenants SET weight = ? WHERE tenant = ?", ( args.weight, args.name ) )
+		print( "==> %s now has a weight of %.2f" % (args.name, args.weight) )
+
+	conn.close()
+
+
+if __name__ == "__main__":
+	main()
@@ -0,0 +1,178 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# mergeTranscripts.py
+#
+# Purpose: Merges the Transcribe outputs of a recording that was split into several parts
+#          into a single stream of items on one timeline.  Each part's timings are relative
+#          to the start of the part, so they are shifted by the part's offset on the fly, and
+#          the parts are combined with a heap based k-way merge.  The merged items are
+#          produced lazily, so the phrase builder consumes them without a combined
+#          transcript ever being built.
+#
+#          A part is only read and parsed when the merge reaches its offset, as none of its
+#          items can start before it, and is released once its last item is merged.  Parts
+#          that follow one another on the timeline are therefore held in memory one at a
+#          time; only parts that overlap are held together.
+#
+#          The parts and their offsets are either given directly, or read from a manifest:
+#
+#              { "parts": [ { "transcript": "part1.json", "offset": 0.0 },
+#                           { "transcript": "part2.json", "offset": 1800.0 } ] }
+#
+#          Relative transcript paths in a manifest are relative to the manifest itself.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import heapq
+import json
+import os
+
+import s3Utils
+import transcriptReader
+
+
+
+# ==================================================================================
+# Function: readText
+# Purpose: Return the contents of a local file or s3://bucket/key as text
+# Parameters:
+#                 name - the file name or S3 URI to read
+# ==================================================================================
+def readText( name ):
+	if s3Utils.isS3Uri( name ):
+		return s3Utils.readObject( name ).decode( "utf-8" )
+
+	with open( name, "r" ) as f:
+		return f.read()
+
+
+# ==================================================================================
+# Function: getParts
+# Purpose: Return the list of (transcript, offset) tuples for the parts to merge, either from
+#          the manifest or by pairing up the transcripts and offsets
+# Parameters:
+#                 transcripts - the list of part transcripts, in order
+#                 offsets - the offset in seconds of each part, in the same order
+#                 manifest - the manifest file listing the parts, used instead of the above
+# ==================================================================================
+def getParts( transcripts, offsets, manifest=None ):
+	if manifest:
+		try:
+			parts = json.loads( readText(manifest) )
+		except ValueError as error:
+			raise ValueError( manifest + " is not valid JSON: " + str(error) )
+
+		# Check the manifest up front, rather than fail part way into the merge
+		if not isinstance( parts, dict ) or not isinstance( parts.get("parts"), list ) or not parts["parts"]:
+			raise ValueError( manifest + " has no list of parts" )
+		parts = parts["parts"]
+		for index, part in enumerate( parts ):
+			if not isinstance( part, dict ) or not isinstance( part.get("transcript"), str ):
+				raise ValueError( "Part %d of %s has no transcript" % (index + 1, manifest) )
+			if not isinstance( part.get("offset", 0.0), (int, float) ) or isinstance( part.get("offset"), bool ):
+				raise ValueError( "Part %d of %s has an offset that is not a number" % (index + 1, manifest) )
+
+		def resolve( name ):
+			if s3Utils.isS3Uri( name ) or os.path.isabs( name ):
+				return name
+			if s3Utils.isS3Uri( manifest ):
+				return manifest.rsplit( "/", 1 )[0] + "/" + name
+			return os.path.join( os.path.dirname(manifest), name )
+
+		return [ (resolve(p["transcript"]), float(p.get("offset", 0.0))) for p in parts ]
+
+	if offsets is None or len(offsets) != len(transcripts):
+		raise ValueError( "An offset is needed for each of the %d transcript parts" % len(transcripts) )
+
+	return list( zip( transcripts, [ float(o) for o in offsets ] ) )
+
+
+# ==================================================================================
+# Function: iterWordGroups
+# Purpose: Yield the items of one part as (start_time, items) groups, shifted by the offset.
+#          Punctuation has no timing information of its own, so it is kept in the same
+#          group as the word in front of it and can never be separated from it by the merge
+# Parameters:
+#                 items - the results.items list of one part
+#                 offset - the offset in seconds of the part on the merged timeline
+# ==================================================================================
+def iterWordGroups( items, offset ):
+	start = offset
+	group = []
+
+	for item in items:
+		if item["type"] == "pronunciation":
+			if group:
+				yield ( start, group )
+			start = float( item["start_time"] ) + offset
+			group = [ dict( item, start_time=start, end_time=float(item["end_time"]) + offset ) ]
+		else:
+			group.append( item )
+
+	if group:
+		yield ( start, group )
+
+
+# ==================================================================================
+# Function: iterPartGroups
+# Purpose: Read and parse one part, and yield its word groups for the merge
+# Parameters:
+#                 transcript - the part transcript file or S3 URI
+#                 offset - the offset in seconds of the part on the merged timeline
+#                 backend - the JSON backend to decode it with, see transcriptReader
+# ==================================================================================
+def iterPartGroups( transcript, offset, backend="auto" ):
+	items = transcriptReader.readItems( transcript, backend )
+	for group in iterWordGroups( items, offset ):
+		yield group
+
+
+# ==================================================================================
+# Function: iterMergedItems
+# Purpose: Yield the items of all of the parts, in start time order on the merged timeline.
+#          Items with equal start times keep the order of the parts they came from
+# Parameters:
+#                 parts - the list of (transcript, offset) tuples, see getParts
+#                 backend - the JSON backend to decode the parts with, see transcriptReader
+# ==================================================================================
+def iterMergedItems( parts, backend="auto" ):
+
+	# Each entry is ( start time, part number, group, stream ).  A part that hasn't been read
+	# yet waits in the heap under its offset with no stream, and is opened when it comes
+	# out on top.  Each part has one entry at most, so the part number breaks every tie
+	heap = [ ( offset, x, None, None ) for x, (transcript, offset) in enumerate( parts ) ]
+	heapq.heapify( heap )
+
+	while heap:
+		start, x, group, stream = heapq.heappop( heap )
+
+		if stream is None:
+			transcript, offset = parts[x]
+			stream = iterPartGroups( transcript, offset, backend )
+		else:
+			for item in group:
+				yield item
+
+		# queue the next group of the part, or drop the part once it is used up
+		group = next( stream, None )
+		if group is not None:
+			heapq.heappush( heap, ( group[0], x, group[1], stream ) )
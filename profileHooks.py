@@ -0,0 +1,339 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# profileHooks.py
+#
+# Purpose: The -profile option of the converters.  The conversion core marks its stages,
+#          parse, phrases, text (rendering the output) and write, with stage(), and while a
+#          profile is running each stage is measured with the profilers chosen:
+#
+#              sample   - a sampling profiler: a thread records the stack of the main thread
+#                         every SAMPLE_INTERVAL seconds.  Low overhead, so the times are close
+#                         to those of an unprofiled run.  A sample can only be taken when the
+#                         main thread lets go of the GIL, so a single long call into C, like a
+#                         JSON decode, gets fewer samples than its time.  The stage times are
+#                         always exact
+#              cprofile - cProfile, exact call counts and times but a much slower run.  The
+#                         stats are also saved for pstats, snakeviz, etc.
+#              memory   - tracemalloc, the peak of the memory each stage allocated on top of
+#                         what it started with, and the top lines of code by the memory they
+#                         allocated and still held at its end.  Tracing every allocation slows
+#                         the run down several times, so its stage times are only good for
+#                         comparing runs of the same profile, and it only runs when named
+#
+#          Both CPU profilers write collapsed stacks, one "stage;caller;...;function count" line
+#          per stack, ready for flamegraph.pl, speedscope or inferno.  The cProfile stacks are
+#          rebuilt from its caller / callee times, so deep stacks are approximations.
+#
+#          When no profile is running stage() costs one check, and none of the profilers
+#          are imported.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import contextlib
+import os
+import sys
+import time
+
+
+# The profilers -profile can run, and those it runs when none is named
+PROFILERS = [ "sample", "cprofile", "memory" ]
+DEFAULT_PROFILERS = [ "sample" ]
+
+# Seconds between the samples of the sampling profiler.  Python only switches threads every
+# sys.getswitchinterval() (5 ms by default), so sampling faster than that gains nothing
+SAMPLE_INTERVAL = 0.005
+
+# The deepest stack kept in the collapsed stacks
+MAX_DEPTH = 64
+
+# Root of the stacks sampled outside of every stage
+UNSTAGED = "unstaged"
+
+# The running profile, or None
+session = None
+
+# Returned by stage() when there is nothing to measure
+NO_STAGE = contextlib.nullcontext()
+
+
+
+# ==================================================================================
+# Function: stage
+# Purpose: Return a context manager measuring the with block as one stage of a conversion.
+#          Stages don't nest, a stage inside another one is counted as part of the outer one
+# Parameters:
+#                 name - the name of the stage, e.g. "parse"
+# ==================================================================================
+def stage( name ):
+	if session is None or session["stage"] is not None:
+		return NO_STAGE
+	return runStage( name )
+
+
+# ==================================================================================
+# Function: runStage
+# Purpose: Context manager running the profilers of the session over one stage
+# Parameters:
+#                 name - the name of the stage
+# ==================================================================================
+@contextlib.contextmanager
+def runStage( name ):
+	totals = session["stages"].setdefault( name, { "seconds": 0.0, "peak": 0, "allocations": [] } )
+	profile = None
+	traced = False
+
+	if "memory" in session["profilers"]:
+		import tracemalloc
+
+		# forget the allocations made before the stage, so its snapshot only holds the ones it
+		# makes, rather than every object alive, and its peak starts from zero
+		tracemalloc.clear_traces()
+		traced = True
+
+	if "cprofile" in session["profilers"]:
+		import cProfile
+
+		profile = session["cprofiles"].setdefault( name, cProfile.Profile() )
+
+	session["stage"] = name
+	start = time.perf_counter()
+	if profile is not None:
+		profile.enable()
+	try:
+		yield
+	finally:
+		if profile is not None:
+			profile.disable()
+		totals["seconds"] += time.perf_counter() - start
+		session["stage"] = None
+
+		if traced:
+			import tracemalloc
+
+			totals["peak"] = max( totals["peak"], tracemalloc.get_traced_memory()[1] )
+			totals["allocations"] = getTopAllocations( tracemalloc.take_snapshot(), session["top"] )
+
+
+# ==================================================================================
+# Function: start
+# Purpose: Start a profile.  Nothing is measured until the first stage
+# Parameters:
+#                 profilers - the profilers to run, see PROFILERS.  Empty for DEFAULT_PROFILERS
+#                 prefix - the reports are written to files named prefix + ".collapsed", etc.
+#                 top - the number of lines of code in the allocation reports
+# ==================================================================================
+def start( profilers, prefix, top=20 ):
+	global session
+
+	session = { "profilers": profilers or DEFAULT_PROFILERS, "prefix": prefix, "top": top, "stage": None,
+	            "stages": {}, "cprofiles": {}, "samples": {}, "sampler": None }
+
+	if "memory" in session["profilers"]:
+		import tracemalloc
+		tracemalloc.start()
+
+	if "sample" in session["profilers"]:
+		import threading
+
+		session["stopSampler"] = threading.Event()
+		session["sampler"] = threading.Thread( target=sampleStacks, args=( threading.get_ident(), session ), daemon=True )
+		session["sampler"].start()
+
+
+# ==================================================================================
+# Function: sampleStacks
+# Purpose: The loop of the sampling thread, counting the stacks of the main thread by stage
+# Parameters:
+#                 thread - the id of the thread to sample
+#                 profile - the session, its samples are counted in profile["samples"] until
+#                           profile["stopSampler"] is set
+# ==================================================================================
+def sampleStacks( thread, profile ):
+	samples = profile["samples"]
+	while not profile["stopSampler"].wait( SAMPLE_INTERVAL ):
+		frame = sys._current_frames().get( thread )
+		if frame is None:
+			continue
+
+		stack = []
+		while frame is not None and len(stack) < MAX_DEPTH:
+			stack.append( getFrameLabel( frame.f_code.co_name, frame.f_code.co_filename, frame.f_code.co_firstlineno ) )
+			frame = frame.f_back
+
+		stack.append( profile["stage"] or UNSTAGED )
+		key = ";".join( reversed(stack) )
+		samples[key] = samples.get( key, 0 ) + 1
+
+
+# ==================================================================================
+# Function: getFrameLabel
+# Purpose: Return the name of a function as it is shown in the collapsed stacks
+# Parameters:
+#                 name - the name of the function
+#                 filename - the file it is defined in, "~" for built-in functions
+#                 line - the line it is defined on
+# ==================================================================================
+def getFrameLabel( name, filename, line ):
+	# ; separates the frames of a collapsed stack, and a space its count
+	name = name.replace( ";", ":" ).replace( " ", "_" )
+	if filename == "~":
+		return name
+	return "%s (%s:%d)" % (name, os.path.basename(filename), line)
+
+
+# ==================================================================================
+# Function: getCollapsedFromStats
+# Purpose: Rebuild collapsed stacks, in microseconds, from the stats of a cProfile run.  The
+#          time of a function is split between its callers in proportion to the time each
+#          call path spent in it
+# Parameters:
+#                 stats - the stats dict of a pstats.Stats
+#                 root - the name of the stage, the root of every stack
+#                 counts - dict of collapsed stack -> microseconds, to add the stacks to
+# ==================================================================================
+def getCollapsedFromStats( stats, root, counts ):
+	children = {}
+	for func, ( cc, nc, tt, ct, callers ) in stats.items():
+		for caller, edge in callers.items():
+			children.setdefault( caller, [] ).append( ( func, edge[3] ) )
+
+	def walk( func, path, share ):
+		tt, ct = stats[func][2], stats[func][3]
+		key = ";".join( path )
+		counts[key] = counts.get( key, 0 ) + int( tt * share * 1e6 )
+
+		if len(path) >= MAX_DEPTH or ct <= 0:
+			return
+		for child, edgeTime in children.get( func, [] ):
+			childTime = stats[child][3]
+			label = getFrameLabel( child[2], child[0], child[1] )
+			# recursion is folded into the first call of the function on the path
+			if label in path or childTime <= 0:
+				continue
+			walk( child, path + [ label ], share * edgeTime / childTime )
+
+	for func, value in stats.items():
+		if not value[4]:
+			walk( func, [ root, getFrameLabel( func[2], func[0], func[1] ) ], 1.0 )
+
+
+# ==================================================================================
+# Function: getTopAllocations
+# Purpose: Return the report lines of the lines of code that allocated the most memory still
+#          held at the end of a stage
+# Parameters:
+#                 snapshot - the tracemalloc snapshot at the end of the stage, holding only the
+#                            allocations made since it started
+#                 top - the number of lines of code to report
+# ==================================================================================
+def getTopAllocations( snapshot, top ):
+	import linecache
+	import tracemalloc
+
+	# Filtering the snapshot would run every trace through each filter in Python, so the few
+	# lines of the profiler and the import machinery are skipped in the statistics instead.
+	# Only the most recent frame is traced, so the result is the same
+	ignore = set( [ tracemalloc.__file__, __file__, "<frozen importlib._bootstrap>", "<frozen importlib._bootstrap_external>" ] )
+	lines = []
+	for stat in snapshot.statistics( "lineno" ):
+		if len(lines) == top:
+			break
+		frame = stat.traceback[0]
+		if frame.filename in ignore:
+			continue
+		lines.append( "%10.1f KiB  %9d blocks  %s:%d  %s" % (stat.size / 1024.0, stat.count, frame.filename, frame.lineno,
+		              linecache.getline( frame.filename, frame.lineno ).strip()) )
+	return lines
+
+
+# ==================================================================================
+# Function: writeCollapsed
+# Purpose: Write collapsed stacks to a file, one "stack count" line each
+# Parameters:
+#                 filename - the file to write
+#                 counts - dict of collapsed stack -> count
+# ==================================================================================
+def writeCollapsed( filename, counts ):
+	with open( filename, "w" ) as out:
+		for key in sorted( counts ):
+			if counts[key] > 0:
+				out.write( "%s %d\n" % (key, counts[key]) )
+
+
+# ==================================================================================
+# Function: stop
+# Purpose: Stop the profile, write its reports and print a summary of the stages
+# Parameters:
+#                 None
+# ==================================================================================
+def stop():
+	global session
+
+	if session is None:
+		return
+	profile, session = session, None
+
+	if profile["sampler"] is not None:
+		profile["stopSampler"].set()
+		profile["sampler"].join()
+
+	if "memory" in profile["profilers"]:
+		import tracemalloc
+		tracemalloc.stop()
+
+	written = []
+	if "sample" in profile["profilers"]:
+		writeCollapsed( profile["prefix"] + ".collapsed", profile["samples"] )
+		written.append( profile["prefix"] + ".collapsed" )
+
+	if profile["cprofiles"]:
+		import pstats
+
+		counts = {}
+		combined = None
+		for name, cprofile in profile["cprofiles"].items():
+			stats = pstats.Stats( cprofile )
+			getCollapsedFromStats( stats.stats, name, counts )
+			if combined is None:
+				combined = stats
+			else:
+				combined.add( cprofile )
+		writeCollapsed( profile["prefix"] + ".cprofile.collapsed", counts )
+		combined.dump_stats( profile["prefix"] + ".pstats" )
+		written += [ profile["prefix"] + ".cprofile.collapsed", profile["prefix"] + ".pstats" ]
+
+	if "memory" in profile["profilers"]:
+		with open( profile["prefix"] + ".alloc.txt", "w" ) as out:
+			for name, totals in profile["stages"].items():
+				out.write( "==> %s: peak %.1f MB allocated, top %d lines by memory allocated and still held at the end of the stage\n\n" % (name, totals["peak"] / 1e6, profile["top"]) )
+				for line in totals["allocations"]:
+					out.write( line + "\n" )
+				out.write( "\n" )
+		written.append( profile["prefix"] + ".alloc.txt" )
+
+	print( "\n==> Profile (" + ", ".join(profile["profilers"]) + ")\n" )
+	for name, totals in profile["stages"].items():
+		samples = sum( count for key, count in profile["samples"].items() if key.split(";", 1)[0] == name )
+		print( "\t>>> %-8s %9.1f ms" % (name, totals["seconds"] * 1000) + ( "  %6d samples" % samples if "sample" in profile["profilers"] else "" )
+		       + ( "  peak %8.1f MB" % (totals["peak"] / 1e6) if "memory" in profile["profilers"] else "" ) )
+	for filename in written:
+		print( "\t>>> Wrote " + filename )
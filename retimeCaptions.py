@@ -0,0 +1,255 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# retimeCaptions.py
+#
+# Purpose: Re-times an existing SRT or VTT file, and/or converts it to the other format, without
+#          going back to the Transcribe output.  The times of every cue can be:
+#
+#              - scaled, e.g. for a frame rate change (-scale, or -fps 23.976 25)
+#              - shifted by a fixed offset (-offset)
+#              - shifted by a different amount in each segment of the video, e.g. around an
+#                edit (-shift START END SECONDS, repeated for each segment)
+#
+#          The file is processed one cue at a time, so memory use doesn't grow with its size.
+#          Cues that end up entirely before the start of the video are dropped, and the rest
+#          are renumbered.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import argparse
+import os
+import sys
+import tempfile
+
+
+FORMATS = [ "srt", "vtt" ]
+
+# Separator of the seconds and milliseconds in the time codes of each format
+SEPARATORS = { "srt": ",", "vtt": "." }
+
+
+
+# ==================================================================================
+# Function: parseTimeCode
+# Purpose: Return the number of milliseconds in an SRT (HH:MM:SS,mmm) or VTT (HH:MM:SS.mmm or
+#          MM:SS.mmm) time code.  Hand-rolled, as it runs twice for every cue
+# Parameters:
+#                 timecode - the time code to parse
+# ==================================================================================
+def parseTimeCode( timecode ):
+	# the common case, two digit hours, is sliced directly
+	if len(timecode) == 12:
+		return ( int(timecode[0:2]) * 3600000 + int(timecode[3:5]) * 60000
+		         + int(timecode[6:8]) * 1000 + int(timecode[9:12]) )
+
+	fields = timecode[:-4].split( ":" )
+	millis = int( timecode[-3:] ) + int( fields[-1] ) * 1000 + int( fields[-2] ) * 60000
+	if len(fields) == 3:
+		millis += int( fields[0] ) * 3600000
+	return millis
+
+
+# ==================================================================================
+# Function: formatTimeCode
+# Purpose: Return the time code for a number of milliseconds, as written by the converters
+# Parameters:
+#                 millis - the time in milliseconds
+#                 separator - the separator of the seconds and milliseconds ("," or ".")
+# ==================================================================================
+def formatTimeCode( millis, separator ):
+	return "%02d:%02d:%02d%s%03d" % ( millis // 3600000, (millis // 60000) % 60, (millis // 1000) % 60, separator, millis % 1000 )
+
+
+# ==================================================================================
+# Function: getRetimer
+# Purpose: Return a function that maps the start and end time of a cue, in milliseconds, to
+#          their new times.  Segments are matched on the original start time of the cue, so a
+#          cue is never split across two segments
+# Parameters:
+#                 offset - the seconds added to every time
+#                 scale - the factor every time is multiplied by, before the offset is added
+#                 shifts - list of (start, end, seconds) segments, the seconds are added to the
+#                          times of the cues starting in [start, end)
+# ==================================================================================
+def getRetimer( offset=0.0, scale=1.0, shifts=() ):
+	offsetMillis = offset * 1000
+	segments = [ (start * 1000, end * 1000, seconds * 1000) for start, end, seconds in shifts ]
+
+	def retime( start, end ):
+		shift = offsetMillis
+		for lo, hi, seconds in segments:
+			if lo <= start < hi:
+				shift += seconds
+		return int( round(start * scale + shift) ), int( round(end * scale + shift) )
+
+	return retime
+
+
+# ==================================================================================
+# Function: iterBlocks
+# Purpose: Yield the blocks of a caption file, as lists of lines without line endings.  Blocks
+#          are separated by one or more blank lines
+# Parameters:
+#                 lines - an iterable of the lines of the file
+# ==================================================================================
+def iterBlocks( lines ):
+	block = []
+	for line in lines:
+		line = line.rstrip( "\r\n" )
+		if line:
+			block.append( line )
+		elif block:
+			yield block
+			block = []
+
+	if block:
+		yield block
+
+
+# ==================================================================================
+# Function: iterCaptions
+# Purpose: Re-time the cues of a caption file one at a time, and yield the output file in
+#          pieces, in the output format
+# Parameters:
+#                 lines - an iterable of the lines of the input file (SRT or VTT)
+#                 outFormat - the format of the output (srt or vtt)
+#                 retime - the function mapping the cue times, see getRetimer
+#                 fstyle - the cue settings for VTT output, None to keep those of a VTT input
+# ==================================================================================
+def iterCaptions( lines, outFormat, retime, fstyle=None ):
+	separator = SEPARATORS[outFormat]
+	count = 0
+
+	if outFormat == "vtt":
+		yield "WEBVTT\n\n"
+
+	for block in iterBlocks( lines ):
+		for timing in range( 0, len(block) ):
+			if "-->" in block[timing]:
+				break
+		else:
+			# not a cue: the WEBVTT header is written above, other VTT blocks (NOTE, STYLE,
+			# REGION) only mean something in a VTT file
+			if outFormat == "vtt" and not block[0].startswith( "WEBVTT" ):
+				yield "\n".join( block ) + "\n\n"
+			continue
+
+		fields = block[timing].split( None, 3 )
+		start, end = retime( parseTimeCode(fields[0]), parseTimeCode(fields[2]) )
+
+		# the cue is over before the video starts
+		if end <= 0:
+			continue
+		count += 1
+
+		# SRT cues are numbered, VTT cues keep a name they were given
+		if outFormat == "vtt" and timing > 0 and not block[0].isdigit():
+			cue = block[0] + "\n"
+		else:
+			cue = str(count) + "\n"
+
+		cue += formatTimeCode( max(start, 0), separator ) + " --> " + formatTimeCode( end, separator )
+		if outFormat == "vtt":
+			cue += " " + ( fields[3] if fstyle is None and len(fields) > 3 else fstyle or "" )
+
+		yield cue + "\n" + "\n".join( block[timing + 1:] ) + "\n\n"
+
+
+# ==================================================================================
+# Function: main function
+# Purpose: After processing arguments, re-time and/or convert the caption file
+# Parameters: See arg parser arguments
+#
+# ==================================================================================
+
+def main( argv=None, prog='retimeCaptions.py' ):
+
+	# Get the command line arguments and parse them
+	parser = argparse.ArgumentParser( prog=prog, description='Re-time an SRT or VTT file, and/or convert it to the other format')
+	parser.add_argument('-capin', required=True, help='The SRT or VTT file to process')
+	parser.add_argument('-capout', required=True, help='The SRT or VTT file to output')
+	parser.add_argument('-format', required=False, choices=FORMATS, help='The format of the output.  Default = from the -capout extension')
+	parser.add_argument('-offset', required=False, type=float, default=0.0, help='The seconds to add to every cue, may be negative.  Default = 0')
+	scaling = parser.add_mutually_exclusive_group()
+	scaling.add_argument('-scale', required=False, type=float, default=1.0, help='The factor to multiply every time by.  Default = 1')
+	scaling.add_argument('-fps', required=False, nargs=2, type=float, metavar=('FROM', 'TO'), help='Scale the times for a frame rate change, e.g. -fps 23.976 25')
+	parser.add_argument('-shift', required=False, nargs=3, type=float, action='append', default=[], metavar=('START', 'END', 'SECONDS'), help='Add SECONDS to the cues starting between START and END seconds.  Can be repeated')
+	parser.add_argument('-fstyle', required=False, default=None, help='The style for VTT subtitles to appear on screen.  E.g. "A:middle L:90%%".  Default = keep the style of a VTT input')
+	args = parser.parse_args( argv )
+
+	outFormat = args.format or os.path.splitext( args.capout )[1].lower().lstrip( "." )
+	if outFormat not in FORMATS:
+		parser.error( "can't tell the output format from " + args.capout + ", use -format" )
+
+	scale = args.fps[0] / args.fps[1] if args.fps else args.scale
+
+	# print out parameters and key header information for the user
+	print( "==> retimeCaptions.py <===\n")
+	print( "==> Parameters: ")
+	print( "\t>>> Captions In: " + args.capin )
+	print( "\t>>> Captions Out: " + args.capout + " (" + outFormat + ")" )
+	print( "\t>>> Scale: %g, Offset: %gs" % (scale, args.offset) )
+	for start, end, seconds in args.shift:
+		print( "\t>>> Shift: %gs to %gs by %gs" % (start, end, seconds) )
+
+	retime = getRetimer( args.offset, scale, args.shift )
+
+	print( "\n==> Processing " + args.capin + "\n")
+
+	# The output is written to a temporary file next to it, and only moved over -capout once
+	# it is complete, so -capout can be the input itself, and a failed run leaves it untouched
+	tempName = None
+	try:
+		fd, tempName = tempfile.mkstemp( suffix=".tmp", prefix=os.path.basename(args.capout) + ".", dir=os.path.dirname( os.path.abspath(args.capout) ) )
+
+		# mkstemp makes the file private, give it the permissions open() would have
+		umask = os.umask(0)
+		os.umask(umask)
+		os.chmod( tempName, os.stat(args.capout).st_mode & 0o777 if os.path.exists(args.capout) else 0o666 & ~umask )
+
+		# utf-8-sig skips the byte order mark some editors put in front of the file
+		with open( args.capin, "r", encoding="utf-8-sig" ) as capin, os.fdopen( fd, "w", encoding="utf-8", newline="" ) as capout:
+			for piece in iterCaptions( capin, outFormat, retime, args.fstyle ):
+				capout.write( piece )
+
+		os.replace( tempName, args.capout )
+		tempName = None
+
+	except IOError as error:
+		# Could not read or write a file, exit gracefully
+		print(error)
+		sys.exit(-1)
+
+	except (IndexError, ValueError):
+		print( "\t>>> " + args.capin + " is not a valid SRT or VTT file" )
+		sys.exit(-1)
+
+	finally:
+		if tempName is not None:
+			os.remove( tempName )
+
+	print( "\t>>> " + args.capout + " written\n" )
+	print( "\n==> Processing Complete\n")
+
+
+if __name__ == "__main__":
+	main()
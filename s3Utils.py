@@ -0,0 +1,219 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# s3Utils.py
+#
+# Purpose: Lets the converters read transcripts from, and write their outputs to, Amazon S3
+#          using s3://bucket/key URIs, without staging a copy on local disk first.
+#
+#          A single client with a pooled connection is shared by all threads.  Large objects
+#          are fetched with concurrent ranged GETs, and large outputs are sent as multipart
+#          uploads.  The endpoint can be pointed at any S3 compatible service (e.g. MinIO or
+#          moto_server) with configure() or the AWS_ENDPOINT_URL environment variable.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import io
+import os
+import threading
+
+
+S3_SCHEME = "s3://"
+
+# Objects larger than this are fetched with concurrent ranged GETs of this size
+RANGE_SIZE = 8 * 1024 * 1024
+
+# Outputs larger than this are uploaded as a multipart upload with parts of this size
+MULTIPART_SIZE = 8 * 1024 * 1024
+
+# Settings used to create the shared client, see configure()
+settings = { "endpoint": os.environ.get("AWS_ENDPOINT_URL"), "maxConnections": 10 }
+
+client = None
+clientLock = threading.Lock()
+
+
+
+# ==================================================================================
+# Function: isS3Uri
+# Purpose: Return True if the name is an s3://bucket/key URI rather than a local path
+# Parameters:
+#                 name - the file name or URI to check
+# ==================================================================================
+def isS3Uri( name ):
+	return name.startswith( S3_SCHEME )
+
+
+# ==================================================================================
+# Function: parseS3Uri
+# Purpose: Split an s3://bucket/key URI into its bucket and key
+# Parameters:
+#                 uri - the URI to split
+# ==================================================================================
+def parseS3Uri( uri ):
+	bucket, _, key = uri[len(S3_SCHEME):].partition( "/" )
+	if not bucket:
+		raise ValueError( "Not a valid S3 URI: " + uri )
+	return bucket, key
+
+
+# ==================================================================================
+# Function: configure
+# Purpose: Change the endpoint and/or connection pool size of the shared client.  Must be
+#          called before the first request is made
+# Parameters:
+#                 endpoint - the endpoint URL of the S3 service, None for the AWS default
+#                 maxConnections - the number of pooled connections, should be at least the
+#                                  number of threads making requests
+# ==================================================================================
+def configure( endpoint=None, maxConnections=None ):
+	global client
+
+	with clientLock:
+		if endpoint is not None:
+			settings["endpoint"] = endpoint
+		if maxConnections is not None:
+			settings["maxConnections"] = maxConnections
+		client = None
+
+
+# ==================================================================================
+# Function: getClient
+# Purpose: Return the shared S3 client, creating it on first use.  boto3 is only imported
+#          here, so the converters still work on local files when it isn't installed
+# Parameters:
+#                 None
+# ==================================================================================
+def getClient():
+	global client
+
+	with clientLock:
+		if client is None:
+			try:
+				import boto3
+				from botocore.config import Config
+			except ImportError:
+				raise ImportError( "boto3 is required for s3:// inputs and outputs.  Install it with 'pip install boto3'" )
+
+			client = boto3.client( "s3", endpoint_url=settings["endpoint"],
+			                       config=Config( max_pool_connections=settings["maxConnections"] ) )
+		return client
+
+
+# ==================================================================================
+# Function: listObjects
+# Purpose: Return the URIs of all the objects under an s3://bucket/prefix/ URI
+# Parameters:
+#                 uri - the prefix to list
+#                 suffix - only return keys ending with this (case insensitive)
+# ==================================================================================
+def listObjects( uri, suffix="" ):
+	bucket, prefix = parseS3Uri( uri )
+	paginator = getClient().get_paginator( "list_objects_v2" )
+	from botocore.exceptions import BotoCoreError, ClientError
+
+	uris = []
+	try:
+		for page in paginator.paginate( Bucket=bucket, Prefix=prefix ):
+			for obj in page.get( "Contents", [] ):
+				if obj["Key"].lower().endswith( suffix ):
+					uris.append( S3_SCHEME + bucket + "/" + obj["Key"] )
+	except (BotoCoreError, ClientError) as error:
+		raise IOError( "Could not list " + uri + ": " + str(error) )
+	return uris
+
+
+# ==================================================================================
+# Function: readObject
+# Purpose: Return the contents of an object as bytes, like a local file read in binary mode.
+#          The first RANGE_SIZE bytes are fetched straight away, and the size of the object is
+#          taken from their Content-Range, so a small object costs a single GET.  The rest of a
+#          large one is split into ranges that are fetched concurrently
+# Parameters:
+#                 uri - the s3://bucket/key URI of the object
+#                 workers - the number of concurrent ranged GETs for a large object
+# ==================================================================================
+def readObject( uri, workers=4 ):
+	bucket, key = parseS3Uri( uri )
+	s3 = getClient()
+
+	from botocore.exceptions import BotoCoreError, ClientError
+	from concurrent.futures import ThreadPoolExecutor
+
+	def getRange( start ):
+		end = min( start + RANGE_SIZE, size ) - 1
+		# IfMatch makes sure every range comes from the same version of the object
+		return s3.get_object( Bucket=bucket, Key=key, Range="bytes=%d-%d" % (start, end), IfMatch=etag )["Body"].read()
+
+	try:
+		try:
+			first = s3.get_object( Bucket=bucket, Key=key, Range="bytes=0-%d" % (RANGE_SIZE - 1) )
+		except ClientError as error:
+			# no range of an empty object can be satisfied
+			if error.response.get( "Error", {} ).get( "Code" ) != "InvalidRange":
+				raise
+			return b""
+
+		data = first["Body"].read()
+		etag = first.get( "ETag" )
+
+		# "bytes 0-8388607/20971520", or no Content-Range when the whole object was sent
+		contentRange = first.get( "ContentRange" )
+		size = int( contentRange.rsplit( "/", 1 )[1] ) if contentRange else len(data)
+
+		rest = range( len(data), size, RANGE_SIZE )
+		if len(rest) > 0:
+			if workers < 2:
+				data += b"".join( map( getRange, rest ) )
+			else:
+				# map hands the ranges back in order, so they can simply be joined
+				with ThreadPoolExecutor( min( workers, len(rest) ) ) as pool:
+					data = b"".join( [ data ] + list( pool.map( getRange, rest ) ) )
+
+	except (BotoCoreError, ClientError) as error:
+		# report S3 failures the same way as local file failures
+		raise IOError( "Could not read " + uri + ": " + str(error) )
+
+	return data
+
+
+# ==================================================================================
+# Function: writeObject
+# Purpose: Write text to an object.  Outputs larger than MULTIPART_SIZE are uploaded in
+#          parts concurrently by the boto3 transfer manager
+# Parameters:
+#                 uri - the s3://bucket/key URI of the object
+#                 contents - the text to write
+#                 workers - the number of parts uploaded concurrently
+# ==================================================================================
+def writeObject( uri, contents, workers=4 ):
+	s3 = getClient()
+	from boto3.s3.transfer import TransferConfig
+	from botocore.exceptions import BotoCoreError, ClientError
+
+	bucket, key = parseS3Uri( uri )
+	config = TransferConfig( multipart_threshold=MULTIPART_SIZE, multipart_chunksize=MULTIPART_SIZE,
+	                         max_concurrency=workers, use_threads=workers > 1 )
+
+	try:
+		s3.upload_fileobj( io.BytesIO( contents.encode("utf-8") ), bucket, key, Config=config )
+	except (BotoCoreError, ClientError) as error:
+		raise IOError( "Could not write " + uri + ": " + str(error) )
@@ -0,0 +1,83 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_batchConvert.py
+#
+# Purpose: Tests of the read / convert / write pipeline of batchConvert.py
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import asyncio
+import os
+import shutil
+
+import pytest
+
+import batchConvert
+from conftest import ROOT
+
+BASIC = os.path.join( ROOT, "benchmarks", "fixtures", "basic.json" )
+
+
+# A transcript that isn't valid text, or JSON, fails on its own and the rest are converted
+def test_bad_transcript_is_a_failure( tmp_path ):
+	shutil.copy( BASIC, str(tmp_path / "basic.json") )
+	(tmp_path / "bad.json").write_bytes( b"\xff\xfe{}" )
+	(tmp_path / "truncated.json").write_bytes( b"{\"results\": {\"items\": [" )
+	outdir = tmp_path / "out"
+	outdir.mkdir()
+
+	files = batchConvert.getTranscriptFiles( [ str(tmp_path) ] )
+	failures = asyncio.run( batchConvert.runPipeline( files, str(outdir), [ "srt", "vtt" ], "", "1.0", 1, 2, 4 ) )
+
+	assert sorted( os.path.basename(f) for f, error in failures ) == [ "bad.json", "truncated.json" ]
+	assert sorted( os.listdir(str(outdir)) ) == [ "basic.srt", "basic.vtt" ]
+
+
+# A failed write is recorded against its transcript, whatever the error
+def test_write_error_is_a_failure( tmp_path, monkeypatch ):
+	def failWrite( filename, contents ):
+		raise UnicodeEncodeError( "utf-8", "x", 0, 1, "can't encode" )
+
+	monkeypatch.setattr( batchConvert, "writeFile", failWrite )
+	failures = asyncio.run( batchConvert.runPipeline( [ BASIC ], str(tmp_path), [ "srt" ], "", "1.0", 1, 2, 4 ) )
+
+	assert [ (f, type(error)) for f, error in failures ] == [ (BASIC, UnicodeEncodeError) ]
+
+
+# Transcripts are read as bytes, and a missing one is an IOError in the failures
+def test_read_file( tmp_path ):
+	assert batchConvert.readFile( BASIC ) == open( BASIC, "rb" ).read()
+
+	failures = asyncio.run( batchConvert.runPipeline( [ str(tmp_path / "missing.json") ], str(tmp_path), [ "srt" ], "", "1.0", 1, 2, 4 ) )
+	assert isinstance( failures[0][1], IOError )
+
+
+# No workers would never finish the batch, and a prefetch of 0 would leave the queues unbounded
+@pytest.mark.parametrize( "option", [ "-cpuworkers", "-ioworkers", "-prefetch" ] )
+@pytest.mark.parametrize( "value", [ "0", "-2", "1.5", "many" ] )
+def test_counts_must_be_positive( option, value, tmp_path, capsys ):
+	with pytest.raises( SystemExit ) as error:
+		batchConvert.main( [ "-transin", BASIC, "-outdir", str(tmp_path), option, value ] )
+
+	assert error.value.code == 2
+	assert "argument " + option in capsys.readouterr().err
+	assert os.listdir( str(tmp_path) ) == []
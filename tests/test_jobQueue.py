@@ -0,0 +1,196 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_jobQueue.py
+#
+# Purpose: Tests of the scheduling, retries and dead letters of jobQueue.py.  The clock is
+#          replaced, so the jobs take exactly as long as each test says
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import os
+import threading
+
+import pytest
+
+import jobQueue
+from conftest import ROOT
+
+BASIC = os.path.join( ROOT, "benchmarks", "fixtures", "basic.json" )
+
+
+# A clock that only moves when it is told to
+class Clock:
+	def __init__( self ):
+		self.now = 1000000.0
+
+	def __call__( self ):
+		return self.now
+
+
+@pytest.fixture
+def clock( monkeypatch ):
+	clock = Clock()
+	monkeypatch.setattr( jobQueue.time, "time", clock )
+	return clock
+
+
+@pytest.fixture
+def conn( tmp_path ):
+	conn = jobQueue.connect( str(tmp_path / "queue.db") )
+	yield conn
+	conn.close()
+
+
+def submit( conn, count, tenant="default", priority=jobQueue.PRIORITIES["normal"], maxAttempts=3 ):
+	return jobQueue.submitJobs( conn, [ "t%d.json" % x for x in range(0, count) ], "out", [ "srt" ], {}, tenant, priority, maxAttempts )
+
+
+def getJob( conn, jobId ):
+	return conn.execute( "SELECT * FROM jobs WHERE id = ?", ( jobId, ) ).fetchone()
+
+
+def getUsage( conn, tenant ):
+	return conn.execute( "SELECT usage FROM tenants WHERE tenant = ?", ( tenant, ) ).fetchone()[0]
+
+
+# Higher priorities go first, whatever order they were submitted in, then the oldest job
+def test_priority_order( conn, clock ):
+	backfill = submit( conn, 2, priority=jobQueue.PRIORITIES["backfill"] )
+	normal = submit( conn, 2 )
+	urgent = submit( conn, 1, priority=jobQueue.PRIORITIES["interactive"] )
+
+	claimed = []
+	for _ in range( 0, 5 ):
+		job = jobQueue.claimJob( conn, "w" )
+		jobQueue.finishJob( conn, job )
+		claimed.append( job["id"] )
+
+	assert claimed == urgent + normal + backfill
+	assert jobQueue.claimJob( conn, "w" ) is None
+
+
+# A worker reserved for urgent jobs leaves the others alone
+def test_min_priority( conn, clock ):
+	submit( conn, 1 )
+	assert jobQueue.claimJob( conn, "w", minPriority=jobQueue.PRIORITIES["interactive"] ) is None
+	assert jobQueue.claimJob( conn, "w" ) is not None
+
+
+# Tenants backfilling at the same priority share the claims in proportion to their weights
+def test_fair_share( conn, clock ):
+	submit( conn, 300, tenant="teamA" )
+	submit( conn, 300, tenant="teamB" )
+	jobQueue.main( [ "-db", conn.execute( "PRAGMA database_list" ).fetchone()[2], "tenant", "-name", "teamB", "-weight", "2" ] )
+
+	counts = { "teamA": 0, "teamB": 0 }
+	for _ in range( 0, 300 ):
+		job = jobQueue.claimJob( conn, "w" )
+		clock.now += 1.0
+		jobQueue.finishJob( conn, job )
+		counts[job["tenant"]] += 1
+
+	assert abs( counts["teamB"] - 200 ) <= 2
+
+
+@pytest.mark.parametrize( "weight", [ "0", "-1", "nan", "inf", "heavy" ] )
+def test_bad_weight_is_rejected( tmp_path, weight ):
+	with pytest.raises( SystemExit ) as exit:
+		jobQueue.main( [ "-db", str(tmp_path / "queue.db"), "tenant", "-name", "teamA", "-weight", weight ] )
+	assert exit.value.code == 2
+
+
+# An IOError is retried after a back-off that doubles on every attempt, and is a dead letter
+# once the job is out of attempts
+def test_retry_then_dead_letter( conn, clock ):
+	jobId = submit( conn, 1, maxAttempts=3 )[0]
+
+	for attempt in range( 1, 4 ):
+		job = jobQueue.claimJob( conn, "w" )
+		assert job["id"] == jobId and job["attempts"] == attempt
+		jobQueue.finishJob( conn, job, IOError("S3 is down"), backoff=5.0 )
+
+		if attempt < 3:
+			assert getJob( conn, jobId )["state"] == "queued"
+			assert getJob( conn, jobId )["available"] == clock.now + 5.0 * 2 ** (attempt - 1)
+
+			# not before the back-off is over
+			clock.now += 5.0 * 2 ** (attempt - 1) - 0.5
+			assert jobQueue.claimJob( conn, "w" ) is None
+			clock.now += 0.5
+
+	row = getJob( conn, jobId )
+	assert row["state"] == "dead" and row["error"] == "OSError: S3 is down"
+	assert jobQueue.claimJob( conn, "w" ) is None
+
+	# and it can be put back on the queue
+	jobQueue.main( [ "-db", conn.execute( "PRAGMA database_list" ).fetchone()[2], "requeue", "-ids", str(jobId) ] )
+	assert jobQueue.claimJob( conn, "w" )["id"] == jobId
+
+
+# Other errors, like a transcript that isn't valid, won't get better with a retry
+def test_bad_transcript_is_a_dead_letter( conn, clock ):
+	jobId = submit( conn, 1 )[0]
+
+	jobQueue.finishJob( conn, jobQueue.claimJob( conn, "w" ), ValueError("not a transcript") )
+
+	row = getJob( conn, jobId )
+	assert row["state"] == "dead" and row["attempts"] == 1 and row["error"] == "ValueError: not a transcript"
+
+
+# A job whose worker stops renewing its lease is taken over, and the late finish of the first
+# worker changes neither the job nor the usage of its tenant
+def test_expired_lease( conn, clock ):
+	jobId = submit( conn, 1 )[0]
+	first = jobQueue.claimJob( conn, "w1", lease=10.0 )
+	assert not jobQueue.renewLease( conn, first, "w2" )
+
+	clock.now += 11.0
+	second = jobQueue.claimJob( conn, "w2", lease=10.0 )
+	assert second["id"] == jobId and second["attempts"] == 2
+
+	usage = getUsage( conn, "default" )
+	clock.now += 30.0
+	jobQueue.finishJob( conn, first )
+	assert getJob( conn, jobId )["state"] == "running" and getJob( conn, jobId )["worker"] == "w2"
+	assert getUsage( conn, "default" ) == usage
+
+	jobQueue.finishJob( conn, second )
+	assert getJob( conn, jobId )["state"] == "done"
+	assert getUsage( conn, "default" ) == pytest.approx( usage + 30.0 - second["charged"] )
+
+
+# A worker converts the jobs and exits once the queue is drained
+def test_worker_runs_jobs( tmp_path ):
+	bad = tmp_path / "bad.json"
+	bad.write_bytes( b"\xff\xfe{}" )
+	db = str(tmp_path / "queue.db")
+	outdir = tmp_path / "out"
+
+	conn = jobQueue.connect( db )
+	good, broken = jobQueue.submitJobs( conn, [ BASIC, str(bad) ], str(outdir), [ "srt", "vtt" ], {}, "default", jobQueue.PRIORITIES["normal"], 3 )
+
+	jobQueue.runWorker( db, "w", None, 0.01, True, threading.Event() )
+
+	assert getJob( conn, good )["state"] == "done"
+	assert getJob( conn, broken )["state"] == "dead"
+	assert sorted( os.listdir(str(outdir)) ) == [ "basic.srt", "basic.vtt" ]
+	conn.close()
@@ -0,0 +1,202 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_mergeTranscripts.py
+#
+# Purpose: Tests of the k-way merge of transcript parts in mergeTranscripts.py
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import json
+import os
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+import createSRTfromTranscriptionFile
+import createVTTfromTranscriptionFile
+import createSSMLfromTranscriptionFile
+import mergeTranscripts
+
+sys.path.insert( 0, os.path.join( ROOT, "benchmarks" ) )
+
+import regressionHarness
+
+
+# Build the items of a part from (content, start) tuples, a start of None for punctuation
+def makeItems( words ):
+	items = []
+	for content, start in words:
+		if start is None:
+			items.append( { "type": "punctuation", "alternatives": [ { "content": content } ] } )
+		else:
+			items.append( { "type": "pronunciation", "start_time": "%.2f" % start, "end_time": "%.2f" % (start + 0.5),
+			                "alternatives": [ { "content": content } ] } )
+	return items
+
+
+# Serve the parts from memory, and log when each one is read
+def fakeParts( monkeypatch, parts ):
+	log = []
+
+	def readItems( name, backend="auto" ):
+		log.append( "read " + name )
+		return parts[name]
+
+	monkeypatch.setattr( mergeTranscripts.transcriptReader, "readItems", readItems )
+	return log
+
+
+def getWords( items ):
+	return [ item["alternatives"][0]["content"] for item in items ]
+
+
+# Overlapping parts interleave by start time, punctuation stays behind its word, and equal
+# start times keep the order of the parts
+def test_merge_order( monkeypatch ):
+	fakeParts( monkeypatch, {
+		"a": makeItems( [ ("a1", 0.0), ("a2", 2.0), (",", None), ("a3", 4.0) ] ),
+		"b": makeItems( [ ("b1", 0.0), ("b2", 1.0), (".", None), ("b3", 2.5) ] ) } )
+
+	merged = list( mergeTranscripts.iterMergedItems( [ ("a", 0.0), ("b", 1.0) ] ) )
+
+	assert getWords( merged ) == [ "a1", "b1", "a2", ",", "b2", ".", "b3", "a3" ]
+	assert [ item["start_time"] for item in merged if item["type"] == "pronunciation" ] == [ 0.0, 1.0, 2.0, 2.0, 3.5, 4.0 ]
+
+
+# A part is read only when the merge reaches its offset, so parts that follow one another are
+# never read at the same time
+def test_parts_are_read_lazily( monkeypatch ):
+	log = fakeParts( monkeypatch, {
+		"p1": makeItems( [ ("one", 0.0), ("two", 1.0) ] ),
+		"p2": makeItems( [ ("three", 0.0), ("four", 1.0) ] ),
+		"p3": makeItems( [ ("five", 0.0) ] ) } )
+
+	for item in mergeTranscripts.iterMergedItems( [ ("p3", 20.0), ("p1", 0.0), ("p2", 10.0) ] ):
+		log.append( item["alternatives"][0]["content"] )
+
+	assert log == [ "read p1", "one", "two", "read p2", "three", "four", "read p3", "five" ]
+
+
+def test_empty_part( monkeypatch ):
+	fakeParts( monkeypatch, { "empty": [], "p": makeItems( [ ("word", 0.0) ] ) } )
+
+	assert getWords( mergeTranscripts.iterMergedItems( [ ("empty", 0.0), ("p", 5.0) ] ) ) == [ "word" ]
+
+
+def test_get_parts():
+	assert mergeTranscripts.getParts( [ "a.json", "b.json" ], [ 0, 1800.5 ] ) == [ ("a.json", 0.0), ("b.json", 1800.5) ]
+
+	with pytest.raises( ValueError ):
+		mergeTranscripts.getParts( [ "a.json", "b.json" ], [ 0 ] )
+	with pytest.raises( ValueError ):
+		mergeTranscripts.getParts( [ "a.json", "b.json" ], None )
+
+
+# Relative paths are relative to the manifest, absolute paths and S3 URIs are kept as they are
+def test_manifest_paths( tmp_path, monkeypatch ):
+	parts = { "parts": [ { "transcript": "a.json" }, { "transcript": "sub/b.json", "offset": 60 },
+	                     { "transcript": "/data/c.json", "offset": 120.5 }, { "transcript": "s3://other/d.json", "offset": 180 } ] }
+	manifest = tmp_path / "manifest.json"
+	manifest.write_text( json.dumps(parts), encoding="utf-8" )
+
+	assert mergeTranscripts.getParts( None, None, str(manifest) ) == [
+		(os.path.join( str(tmp_path), "a.json" ), 0.0), (os.path.join( str(tmp_path), "sub/b.json" ), 60.0),
+		("/data/c.json", 120.5), ("s3://other/d.json", 180.0) ]
+
+	monkeypatch.setattr( mergeTranscripts, "readText", lambda name: json.dumps(parts) )
+	assert [ name for name, offset in mergeTranscripts.getParts( None, None, "s3://bucket/show/manifest.json" ) ] == [
+		"s3://bucket/show/a.json", "s3://bucket/show/sub/b.json", "/data/c.json", "s3://other/d.json" ]
+
+
+@pytest.mark.parametrize( "manifest", [
+	"not json", "[]", "{}", '{ "parts": [] }', '{ "parts": [ "a.json" ] }', '{ "parts": [ { "offset": 10 } ] }',
+	'{ "parts": [ { "transcript": "a.json", "offset": "ten" } ] }' ] )
+def test_invalid_manifest( manifest, tmp_path ):
+	name = tmp_path / "manifest.json"
+	name.write_text( manifest, encoding="utf-8" )
+
+	with pytest.raises( ValueError ):
+		mergeTranscripts.getParts( None, None, str(name) )
+
+
+# ==================================================================================
+# The merge through the converters' command lines
+# ==================================================================================
+
+# Split a transcript in two at the first word from the given time, the second part timed
+# from its offset like a recording cut at that point
+def splitTranscript( transcript, at ):
+	items = transcript["results"]["items"]
+	cut = next( i for i, item in enumerate(items) if item["type"] == "pronunciation" and float(item["start_time"]) >= at )
+
+	second = []
+	for item in items[cut:]:
+		if item["type"] == "pronunciation":
+			item = dict( item, start_time="%.2f" % (float(item["start_time"]) - at), end_time="%.2f" % (float(item["end_time"]) - at) )
+		second.append( item )
+
+	return ( { "results": { "transcripts": [], "items": items[:cut] } },
+	         { "results": { "transcripts": [], "items": second } } )
+
+
+def writeJSON( name, value ):
+	name.write_text( json.dumps(value), encoding="utf-8" )
+	return str(name)
+
+
+def runConverters( tmp_path, inputs ):
+	outputs = {}
+	for module, option, ext, extra in [ (createSRTfromTranscriptionFile, "-srtout", ".srt", []),
+	                                    (createVTTfromTranscriptionFile, "-vttout", ".vtt", [ "-fstyle", regressionHarness.FSTYLE ]),
+	                                    (createSSMLfromTranscriptionFile, "-ssmlout", ".ssml", [ "-pcttimepad", regressionHarness.PCTTIMEPAD ]) ]:
+		name = str( tmp_path / ("out" + ext) )
+		regressionHarness.quietly( module.main, inputs + [ option, name ] + extra )
+		outputs[ext] = regressionHarness.readBytes( name )
+	return outputs
+
+
+def getGoldens( fixture ):
+	return dict( (ext, regressionHarness.readBytes( os.path.join(regressionHarness.GOLDEN, fixture + ext) )) for ext in [ ".srt", ".vtt", ".ssml" ] )
+
+
+# A transcript split in two and merged back gives exactly the output of the whole one
+def test_split_and_merged_matches_golden( tmp_path ):
+	with open( os.path.join(regressionHarness.FIXTURES, "hourplus.json"), "r", encoding="utf-8" ) as f:
+		first, second = splitTranscript( json.load(f), 3600.0 )
+	assert first["results"]["items"] and second["results"]["items"]
+
+	part1 = writeJSON( tmp_path / "part1.json", first )
+	part2 = writeJSON( tmp_path / "part2.json", second )
+	manifest = writeJSON( tmp_path / "manifest.json", { "parts": [ { "transcript": "part1.json" }, { "transcript": "part2.json", "offset": 3600.0 } ] } )
+
+	assert runConverters( tmp_path, [ "-transin", part1, part2, "-offsets", "0", "3600" ] ) == getGoldens( "hourplus" )
+	assert runConverters( tmp_path, [ "-manifest", manifest ] ) == getGoldens( "hourplus" )
+
+
+# A single part with -offsets is shifted by its offset, rather than the offset being ignored
+def test_single_part_with_offset( tmp_path ):
+	outputs = runConverters( tmp_path, [ "-transin", os.path.join(regressionHarness.FIXTURES, "basic.json"), "-offsets", "3600" ] )
+
+	assert outputs[".srt"].startswith( b"1\n01:00:00,520 --> 01:00:04,470\n" )
+	assert b"\n01:00:00.520 --> 01:00:04.470 " in outputs[".vtt"]
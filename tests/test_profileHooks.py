@@ -0,0 +1,81 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_profileHooks.py
+#
+# Purpose: Tests of the -profile option of the converters, profileHooks.py
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import os
+import tracemalloc
+
+import pytest
+
+import createSRTfromTranscriptionFile
+import createVTTfromTranscriptionFile
+import profileHooks
+from conftest import ROOT
+
+BASIC = os.path.join( ROOT, "benchmarks", "fixtures", "basic.json" )
+
+
+def test_memory_profile( tmp_path ):
+	srt = str(tmp_path / "basic.srt")
+
+	createSRTfromTranscriptionFile.main( [ "-transin", BASIC, "-srtout", srt, "-profile", "memory" ] )
+
+	with open( srt + ".profile.alloc.txt" ) as f:
+		report = f.read()
+	for name in [ "parse", "phrases", "text", "write" ]:
+		assert "==> " + name + ": peak " in report
+	assert "captionCore.py" in report
+	assert "profileHooks.py" not in report and "tracemalloc.py" not in report
+	assert not tracemalloc.is_tracing()
+
+
+# A conversion that fails still stops the profile and writes its reports
+def test_profile_stopped_on_failure( tmp_path ):
+	bad = tmp_path / "bad.json"
+	bad.write_text( "{\"results\": {\"items\": [" )
+	missing = str(tmp_path / "missing.json")
+	vtt = str(tmp_path / "out.vtt")
+
+	for transin in [ missing, str(bad) ]:
+		# a missing file exits, and a broken one raises out of the decoder
+		with pytest.raises( (SystemExit, ValueError) ) as error:
+			createVTTfromTranscriptionFile.main( [ "-transin", transin, "-vttout", vtt, "-fstyle", "", "-profile", "sample", "memory" ] )
+		assert isinstance( error.value, ValueError ) or error.value.code == -1
+
+		assert profileHooks.session is None
+		assert not tracemalloc.is_tracing()
+		assert os.path.exists( vtt + ".profile.collapsed" ) and os.path.exists( vtt + ".profile.alloc.txt" )
+		os.remove( vtt + ".profile.collapsed" )
+
+
+# The default profile only samples, tracemalloc slows the run down too much to be on by default
+def test_default_profile( tmp_path ):
+	srt = str(tmp_path / "basic.srt")
+
+	createSRTfromTranscriptionFile.main( [ "-transin", BASIC, "-srtout", srt, "-profile" ] )
+
+	assert os.path.exists( srt + ".profile.collapsed" )
+	assert not os.path.exists( srt + ".profile.alloc.txt" )
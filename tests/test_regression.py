@@ -0,0 +1,60 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_regression.py
+#
+# Purpose: Runs the golden output check of benchmarks/regressionHarness.py from pytest, one test
+#          per fixture transcript, and checks the converters still provide the functions they
+#          used to define.  The performance budgets are checked by the harness itself
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import os
+import sys
+
+import pytest
+
+from conftest import ROOT
+
+sys.path.insert( 0, os.path.join( ROOT, "benchmarks" ) )
+
+import regressionHarness
+
+
+@pytest.mark.parametrize( "fixture", regressionHarness.getFixtures() )
+def test_golden_outputs( fixture, tmp_path ):
+	with open( os.path.join(regressionHarness.FIXTURES, fixture), "r", encoding="utf-8" ) as f:
+		outputs = regressionHarness.convertFixture( f.read(), str(tmp_path), regressionHarness.LANGS.get(fixture, "en") )
+
+	for ext in regressionHarness.OUTPUTS:
+		golden = os.path.join( regressionHarness.GOLDEN, os.path.splitext(fixture)[0] + ext )
+		assert outputs[ext] == regressionHarness.readBytes( golden ), golden
+
+
+# The functions that moved to captionCore can still be imported from the converters, with
+# the time codes each of them used to produce
+@pytest.mark.parametrize( "module, separator", [
+	(regressionHarness.srt, ","), (regressionHarness.vtt, "."), (regressionHarness.ssml, ",") ] )
+def test_reexports( module, separator ):
+	for name in [ "newPhrase", "getTimeCode", "getPhrasesFromTranscript", "getPhraseText" ]:
+		assert callable( getattr(module, name) ), name
+
+	assert module.getTimeCode( 3723.456 ) == "01:02:03" + separator + "456"
@@ -0,0 +1,165 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_retimeCaptions.py
+#
+# Purpose: Tests of the re-timing and SRT / VTT conversion of retimeCaptions.py
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import pytest
+
+import retimeCaptions
+
+SRT = """1
+00:00:01,000 --> 00:00:02,500
+first cue
+
+2
+00:00:10,000 --> 00:00:12,000
+second cue
+two lines
+
+3
+01:00:00,250 --> 01:00:01,000
+third cue
+"""
+
+VTT = """WEBVTT
+
+NOTE a comment
+
+intro
+00:01.000 --> 00:02.500 align:start
+first cue
+
+00:00:10.000 --> 00:00:12.000 line:0
+second cue
+"""
+
+
+def convert( text, outFormat, retime=None, fstyle=None ):
+	return "".join( retimeCaptions.iterCaptions( text.splitlines( True ), outFormat, retime or retimeCaptions.getRetimer(), fstyle ) )
+
+
+def getTimings( text ):
+	return [ line for line in text.splitlines() if "-->" in line ]
+
+
+@pytest.mark.parametrize( "timecode, millis", [
+	( "00:00:01,000", 1000 ),
+	( "01:02:03,456", 3723456 ),
+	( "12:00:00.001", 43200001 ),
+	( "02:03.456", 123456 ),
+	( "1:02:03.456", 3723456 ),
+	( "123:00:00,000", 442800000 ) ] )
+def test_parse_time_code( timecode, millis ):
+	assert retimeCaptions.parseTimeCode( timecode ) == millis
+
+
+def test_format_time_code():
+	assert retimeCaptions.formatTimeCode( 3723456, "," ) == "01:02:03,456"
+	assert retimeCaptions.formatTimeCode( 90000000, "." ) == "25:00:00.000"
+
+
+def test_unchanged_srt_round_trips():
+	assert convert( SRT, "srt" ) == SRT + "\n"
+
+
+def test_offset():
+	out = convert( SRT, "srt", retimeCaptions.getRetimer( offset=1.5 ) )
+	assert getTimings( out ) == [ "00:00:02,500 --> 00:00:04,000", "00:00:11,500 --> 00:00:13,500", "01:00:01,750 --> 01:00:02,500" ]
+	assert "second cue\ntwo lines\n" in out
+
+
+def test_scale():
+	assert getTimings( convert( SRT, "srt", retimeCaptions.getRetimer( scale=2.0 ) ) )[1] == "00:00:20,000 --> 00:00:24,000"
+
+
+# -fps 25 24 slows 25 fps video down to 24 fps, so every time grows by 25 / 24
+def test_fps( tmp_path ):
+	capin = tmp_path / "in.srt"
+	capin.write_text( SRT, encoding="utf-8" )
+	capout = tmp_path / "out.srt"
+
+	retimeCaptions.main( [ "-capin", str(capin), "-capout", str(capout), "-fps", "25", "24" ] )
+
+	assert getTimings( capout.read_text(encoding="utf-8") )[2] == "01:02:30,260 --> 01:02:31,042"
+
+
+def test_shift_segments():
+	retime = retimeCaptions.getRetimer( offset=1.0, shifts=[ (5.0, 20.0, 2.0), (3000.0, 4000.0, -60.0) ] )
+	assert getTimings( convert( SRT, "srt", retime ) ) == [
+		"00:00:02,000 --> 00:00:03,500", "00:00:13,000 --> 00:00:15,000", "00:59:01,250 --> 00:59:02,000" ]
+
+
+# Cues over before zero are dropped and the rest renumbered, a cue running over zero starts at it
+def test_drop_and_renumber():
+	out = convert( SRT, "srt", retimeCaptions.getRetimer( offset=-11.0 ) )
+	assert out.startswith( "1\n00:00:00,000 --> 00:00:01,000\nsecond cue\n" )
+	assert "2\n00:59:49,250 --> 00:59:50,000\nthird cue\n" in out
+	assert "first cue" not in out
+
+
+def test_srt_to_vtt():
+	out = convert( SRT, "vtt", fstyle="A:middle L:90%" )
+	assert out.startswith( "WEBVTT\n\n1\n00:00:01.000 --> 00:00:02.500 A:middle L:90%\nfirst cue\n" )
+
+	# without -fstyle an SRT cue has no settings
+	assert getTimings( convert( SRT, "vtt" ) )[0] == "00:00:01.000 --> 00:00:02.500 "
+
+
+def test_vtt_keeps_its_settings():
+	out = convert( VTT, "vtt" )
+	assert out.startswith( "WEBVTT\n\nNOTE a comment\n\nintro\n00:00:01.000 --> 00:00:02.500 align:start\nfirst cue\n" )
+	assert "00:00:10.000 --> 00:00:12.000 line:0\n" in out
+
+	# -fstyle replaces them
+	assert getTimings( convert( VTT, "vtt", fstyle="A:middle" ) )[1] == "00:00:10.000 --> 00:00:12.000 A:middle"
+
+
+def test_vtt_to_srt():
+	assert convert( VTT, "srt" ) == "1\n00:00:01,000 --> 00:00:02,500\nfirst cue\n\n2\n00:00:10,000 --> 00:00:12,000\nsecond cue\n\n"
+
+
+# The output can be the input itself
+def test_in_place( tmp_path ):
+	captions = tmp_path / "a.srt"
+	captions.write_text( SRT, encoding="utf-8" )
+
+	retimeCaptions.main( [ "-capin", str(captions), "-capout", str(captions), "-offset", "2" ] )
+
+	assert getTimings( captions.read_text(encoding="utf-8") )[0] == "00:00:03,000 --> 00:00:04,500"
+	assert [ p.name for p in tmp_path.iterdir() ] == [ "a.srt" ]
+
+
+# A file that isn't valid leaves the output as it was
+def test_invalid_input_keeps_output( tmp_path ):
+	bad = tmp_path / "bad.srt"
+	bad.write_text( "1\nnot a time --> either\ntext\n", encoding="utf-8" )
+	out = tmp_path / "out.vtt"
+	out.write_text( "keep me", encoding="utf-8" )
+
+	with pytest.raises( SystemExit ):
+		retimeCaptions.main( [ "-capin", str(bad), "-capout", str(out) ] )
+
+	assert out.read_text( encoding="utf-8" ) == "keep me"
+	assert sorted( p.name for p in tmp_path.iterdir() ) == [ "bad.srt", "out.vtt" ]
@@ -0,0 +1,197 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_s3Utils.py
+#
+# Purpose: Tests of the S3 reads and writes of s3Utils.py, and of the converters and the batch
+#          pipeline on s3:// URIs, against an in-process S3 mocked by moto
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import asyncio
+import os
+
+import pytest
+
+pytest.importorskip( "boto3" )
+moto = pytest.importorskip( "moto" )
+
+import batchConvert
+import createSRTfromTranscriptionFile
+import s3Utils
+from conftest import ROOT
+
+try:
+	from moto import mock_aws
+except ImportError:
+	# moto before 5.0
+	from moto import mock_s3 as mock_aws
+
+FIXTURES = os.path.join( ROOT, "benchmarks", "fixtures" )
+BUCKET = "transcripts"
+
+
+# A mocked S3 with an empty bucket, and a fresh shared client pointed at it
+@pytest.fixture
+def s3( monkeypatch ):
+	monkeypatch.setenv( "AWS_ACCESS_KEY_ID", "testing" )
+	monkeypatch.setenv( "AWS_SECRET_ACCESS_KEY", "testing" )
+	monkeypatch.setenv( "AWS_DEFAULT_REGION", "us-east-1" )
+	monkeypatch.setitem( s3Utils.settings, "endpoint", None )
+
+	with mock_aws():
+		s3Utils.configure()
+		client = s3Utils.getClient()
+		client.create_bucket( Bucket=BUCKET )
+		yield client
+
+	s3Utils.configure()
+
+
+def readFixture( name ):
+	with open( os.path.join(FIXTURES, name), "rb" ) as f:
+		return f.read()
+
+
+def test_parse_uri():
+	assert s3Utils.isS3Uri( "s3://bucket/a/b.json" )
+	assert not s3Utils.isS3Uri( "/tmp/b.json" )
+	assert s3Utils.parseS3Uri( "s3://bucket/a/b.json" ) == ( "bucket", "a/b.json" )
+	with pytest.raises( ValueError ):
+		s3Utils.parseS3Uri( "s3:///b.json" )
+
+
+# Records the operation and Range of every request the client makes
+def recordRequests( s3 ):
+	requests = []
+	s3.meta.events.register( "provide-client-params.s3.*", lambda params, model, **kwargs: requests.append( (model.name, params.get("Range")) ) )
+	return requests
+
+
+# A small object is read with a single GET, and returned as bytes like a local file
+def test_read_small_object( s3 ):
+	s3.put_object( Bucket=BUCKET, Key="in/small.json", Body="Café 東京".encode("utf-8") )
+	requests = recordRequests( s3 )
+
+	assert s3Utils.readObject( "s3://" + BUCKET + "/in/small.json" ) == "Café 東京".encode( "utf-8" )
+	assert requests == [ ("GetObject", "bytes=0-%d" % (s3Utils.RANGE_SIZE - 1)) ]
+
+
+def test_read_empty_object( s3 ):
+	s3.put_object( Bucket=BUCKET, Key="in/empty.json", Body=b"" )
+
+	assert s3Utils.readObject( "s3://" + BUCKET + "/in/empty.json" ) == b""
+
+
+# Objects above RANGE_SIZE are fetched in ranges, and put back together in order even when a
+# range ends in the middle of a multi-byte character
+def test_ranged_read( s3, monkeypatch ):
+	monkeypatch.setattr( s3Utils, "RANGE_SIZE", 1000 )
+	text = "".join( "%05d über 東京\n" % x for x in range(0, 500) )
+	s3.put_object( Bucket=BUCKET, Key="in/large.txt", Body=text.encode("utf-8") )
+
+	requests = recordRequests( s3 )
+
+	assert s3Utils.readObject( "s3://" + BUCKET + "/in/large.txt", workers=4 ).decode( "utf-8" ) == text
+	size = len( text.encode("utf-8") )
+	ranges = [ r for operation, r in requests if operation == "GetObject" ]
+	assert len(requests) == len(ranges) == (size + 999) // 1000
+	assert ranges[0] == "bytes=0-999" and "bytes=%d-%d" % (size // 1000 * 1000, size - 1) in ranges
+
+	# one worker fetches the same ranges one after the other
+	del requests[:]
+	assert s3Utils.readObject( "s3://" + BUCKET + "/in/large.txt", workers=1 ).decode( "utf-8" ) == text
+	assert len(requests) == (size + 999) // 1000
+
+
+def test_multipart_write( s3, monkeypatch ):
+	# S3 won't take parts smaller than 5 MB, other than the last one
+	monkeypatch.setattr( s3Utils, "MULTIPART_SIZE", 5 * 1024 * 1024 )
+	text = "0123456789abcdé\n" * 700000
+
+	s3Utils.writeObject( "s3://" + BUCKET + "/out/big.srt", text )
+
+	head = s3.head_object( Bucket=BUCKET, Key="out/big.srt" )
+	assert head["ETag"].strip( '"' ).endswith( "-3" )
+	assert s3.get_object( Bucket=BUCKET, Key="out/big.srt" )["Body"].read().decode( "utf-8" ) == text
+
+
+def test_list_objects( s3 ):
+	for key in [ "in/a.json", "in/B.JSON", "in/notes.txt", "in/sub/c.json", "inbox/d.json", "other/e.json" ]:
+		s3.put_object( Bucket=BUCKET, Key=key, Body=b"{}" )
+
+	assert sorted( s3Utils.listObjects( "s3://" + BUCKET + "/in/", ".json" ) ) == [
+		"s3://transcripts/in/B.JSON", "s3://transcripts/in/a.json", "s3://transcripts/in/sub/c.json" ]
+	assert len( s3Utils.listObjects( "s3://" + BUCKET + "/in" ) ) == 5
+	assert s3Utils.listObjects( "s3://" + BUCKET + "/none/" ) == []
+
+
+# S3 errors are reported as IOError, like those of local files
+def test_errors_are_ioerrors( s3 ):
+	with pytest.raises( IOError ):
+		s3Utils.readObject( "s3://" + BUCKET + "/in/missing.json" )
+	with pytest.raises( IOError ):
+		s3Utils.writeObject( "s3://nobucket/out/a.srt", "text" )
+	with pytest.raises( IOError ):
+		s3Utils.listObjects( "s3://nobucket/in/" )
+
+
+def test_converter_reads_and_writes_s3( s3 ):
+	s3.put_object( Bucket=BUCKET, Key="in/basic.json", Body=readFixture("basic.json") )
+
+	createSRTfromTranscriptionFile.main( [ "-transin", "s3://" + BUCKET + "/in/basic.json", "-srtout", "s3://" + BUCKET + "/out/basic.srt" ] )
+
+	assert s3.get_object( Bucket=BUCKET, Key="out/basic.srt" )["Body"].read() == readFixture( os.path.join("golden", "basic.srt") )
+
+
+# A manifest on S3 is read as text, and its parts found next to it
+def test_converter_reads_s3_manifest( s3 ):
+	s3.put_object( Bucket=BUCKET, Key="in/show/basic.json", Body=readFixture("basic.json") )
+	s3.put_object( Bucket=BUCKET, Key="in/show/manifest.json", Body=b'{ "parts": [ { "transcript": "basic.json" } ] }' )
+
+	createSRTfromTranscriptionFile.main( [ "-manifest", "s3://" + BUCKET + "/in/show/manifest.json", "-srtout", "s3://" + BUCKET + "/out/show.srt" ] )
+
+	assert s3.get_object( Bucket=BUCKET, Key="out/show.srt" )["Body"].read() == readFixture( os.path.join("golden", "basic.srt") )
+
+
+def test_converter_missing_object_exits( s3 ):
+	with pytest.raises( SystemExit ):
+		createSRTfromTranscriptionFile.main( [ "-transin", "s3://" + BUCKET + "/in/missing.json", "-srtout", "s3://" + BUCKET + "/out/x.srt" ] )
+
+
+# The batch flow: every transcript under a prefix is converted into another prefix, and a missing
+# one is a failure of its own
+def test_batch_prefix( s3 ):
+	for name in [ "basic.json", "punctuation.json" ]:
+		s3.put_object( Bucket=BUCKET, Key="in/" + name, Body=readFixture(name) )
+	s3.put_object( Bucket=BUCKET, Key="in/readme.txt", Body=b"not a transcript" )
+
+	files = batchConvert.getTranscriptFiles( [ "s3://" + BUCKET + "/in/" ] )
+	assert sorted( files ) == [ "s3://transcripts/in/basic.json", "s3://transcripts/in/punctuation.json" ]
+
+	failures = asyncio.run( batchConvert.runPipeline( files + [ "s3://" + BUCKET + "/in/missing.json" ], "s3://" + BUCKET + "/out/",
+	                                                  [ "srt", "vtt" ], "", "1.0", 1, 4, 4 ) )
+
+	assert [ (f, type(error)) for f, error in failures ] == [ ("s3://transcripts/in/missing.json", IOError) ]
+	assert sorted( s3Utils.listObjects( "s3://" + BUCKET + "/out/" ) ) == [
+		"s3://transcripts/out/basic.srt", "s3://transcripts/out/basic.vtt",
+		"s3://transcripts/out/punctuation.srt", "s3://transcripts/out/punctuation.vtt" ]
+	assert s3.get_object( Bucket=BUCKET, Key="out/punctuation.vtt" )["Body"].read().decode( "utf-8" ).startswith( "WEBVTT" )
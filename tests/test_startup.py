@@ -0,0 +1,41 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# test_startup.py
+#
+# Purpose: Runs the start-up budget check of benchmarks/checkStartupTime.py, so the test suite
+#          fails when a subcommand loads a module it has no use for or starts too slowly
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+
+def test_startup_budget():
+	# the budgets are doubled, as on CI, for slow and shared machines
+	result = subprocess.run( [ sys.executable, os.path.join(ROOT, "benchmarks", "checkStartupTime.py"), "-scale", "2" ],
+	                         stdout=subprocess.PIPE, stderr=subprocess.STDOUT, universal_newlines=True )
+
+	assert result.returncode == 0, result.stdout
@@ -0,0 +1,195 @@
+# ==================================================================================
+# Copyright 2020 Amazon.com, Inc. or its affiliates. All Rights Reserved.
+
+# Permission is hereby granted, free of charge, to any person obtaining a copy of this
+# software and associated documentation files (the "Software"), to deal in the Software
+# without restriction, including without limitation the rights to use, copy, modify,
+# merge, publish, distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so.
+
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR IMPLIED,
+# INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY, FITNESS FOR A
+# PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT
+# HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION WITH THE
+# SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+# ==================================================================================
+#
+# transcriptReader.py
+#
+# Purpose: Input layer of the converters.  Local transcripts are memory-mapped rather than
+#          read into a string, and decoded with the fastest JSON backend installed:
+#
+#              orjson   - a complete parse, several times faster than the standard library
+#              simdjson - pysimdjson's lazy parser.  Only the fields of results.items the
+#                         phrase builder uses (type, start_time, end_time and the content
+#                         of the first alternative) are turned into Python objects
+#              json     - the standard library, always available
+#
+#          "auto" picks the first of these that can be imported.  The complete parsers hand
+#          back results.items as they are, since copying out the needed fields after a full
+#          parse costs more time and peak memory than it saves.
+#
+#          The garbage collector is paused while a transcript is decoded.  Decoding creates
+#          several objects per item and no reference cycles, so its passes over the growing
+#          heap are pure overhead, and were about half of the decoding time of a large file.
+#
+# Change Log:
+#          10/18/2026: Initial version
+#
+# ==================================================================================
+
+
+import contextlib
+import gc
+import mmap
+
+import s3Utils
+
+
+# The backends, fastest first, in the order "auto" tries them
+BACKENDS = [ "orjson", "simdjson", "json" ]
+
+
+
+# ==================================================================================
+# Function: getBackend
+# Purpose: Return the name of the backend to use, checking that it can be imported
+# Parameters:
+#                 backend - the backend wanted, or "auto" for the fastest one installed
+# ==================================================================================
+def getBackend( backend="auto" ):
+	import importlib
+
+	if backend != "auto" and backend not in BACKENDS:
+		raise ValueError( "Unknown JSON backend: " + backend )
+
+	for name in ( BACKENDS if backend == "auto" else [ backend ] ):
+		try:
+			importlib.import_module( name )
+			return name
+		except ImportError:
+			if backend != "auto":
+				raise ImportError( "The " + name + " JSON backend is not installed.  Install it with 'pip install " + ( "py" if name == "simdjson" else "" ) + name + "'" )
+
+
+# ==================================================================================
+# Function: openTranscript
+# Purpose: Context manager giving the contents of a transcript for parseItems.  Local files
+#          are memory-mapped, and only stay mapped inside the with block
+# Parameters:
+#                 name - the transcript file or s3://bucket/key URI
+# ==================================================================================
+@contextlib.contextmanager
+def openTranscript( name ):
+	if s3Utils.isS3Uri( name ):
+		yield s3Utils.readObject( name )
+		return
+
+	with open( name, "rb" ) as f:
+		try:
+			mapped = mmap.mmap( f.fileno(), 0, access=mmap.ACCESS_READ )
+		except ValueError:
+			# an empty file can't be mapped
+			yield f.read()
+			return
+
+		try:
+			yield mapped
+		finally:
+			mapped.close()
+
+
+# ==================================================================================
+# Function: pausedCollector
+# Purpose: Context manager that turns off the garbage collector inside the with block, and
+#          back on afterwards if it was on before
+# Parameters:
+#                 None
+# ==================================================================================
+@contextlib.contextmanager
+def pausedCollector():
+	enabled = gc.isenabled()
+	gc.disable()
+	try:
+		yield
+	finally:
+		if enabled:
+			gc.enable()
+
+
+# ==================================================================================
+# Function: parseItems
+# Purpose: Decode a transcript and return its results.items list
+# Parameters:
+#                 transcript - the JSON output from Amazon Transcribe, as a str, bytes or mmap
+#                 backend - the JSON backend to use, or "auto" for the fastest one installed
+# ==================================================================================
+def parseItems( transcript, backend="auto" ):
+	backend = getBackend( backend )
+
+	with pausedCollector():
+		if backend == "json":
+			import json
+
+			# the standard library can't read from a buffer, so an mmap has to be copied
+			if isinstance( transcript, mmap.mmap ):
+				transcript = transcript[:]
+			return json.loads( transcript )["results"]["items"]
+
+		if isinstance( transcript, str ):
+			return loadItems( transcript, backend )
+
+		# the other backends read straight from the mapped pages.  The view has to be
+		# released before the mapping can be closed
+		with memoryview( transcript ) as view:
+			return loadItems( view, backend )
+
+
+# ==================================================================================
+# Function: loadItems
+# Purpose: Decode a transcript with orjson or simdjson, and return its results.items list
+# Parameters:
+#                 data - the JSON output from Amazon Transcribe, as a str or memoryview
+#                 backend - the JSON backend to use, "orjson" or "simdjson"
+# ==================================================================================
+def loadItems( data, backend ):
+	if backend == "orjson":
+		import orjson
+		return orjson.loads( data )["results"]["items"]
+
+	import simdjson
+	return getNeededFields( simdjson.Parser().parse( data ).at_pointer( "/results/items" ) )
+
+
+# ==================================================================================
+# Function: getNeededFields
+# Purpose: Copy just the fields the phrase builder uses out of lazily parsed items, in the
+#          same shape as the Transcribe JSON
+# Parameters:
+#                 items - the results.items array of a lazy parser
+# ==================================================================================
+def getNeededFields( items ):
+	needed = []
+	for item in items:
+		itemType = item["type"]
+		alternatives = [ { "content": item["alternatives"][0]["content"] } ]
+
+		# punctuation doesn't carry timing information
+		if itemType == "pronunciation":
+			needed.append( { "type": itemType, "start_time": item["start_time"], "end_time": item["end_time"], "alternatives": alternatives } )
+		else:
+			needed.append( { "type": itemType, "alternatives": alternatives } )
+	return needed
+
+
+# ==================================================================================
+# Function: readItems
+# Purpose: Read and decode a transcript file, and return its results.items list
+# Parameters:
+#                 name - the transcript file or s3://bucket/key URI
+#                 backend - the JSON backend to use, or "auto" for the fastest one installed
+# ==================================================================================
+def readItems( name, backend="auto" ):
+	with openTranscript( name ) as transcript:
+		return parseItems( transcript, backend )